@@ -464,6 +464,16 @@ class Plugin(PluginBase):
         # 加载日志
         self.updateLogs()
     
+    def _readLaunchTime(self, dev_info):
+        """读取启动时间，它与静态开发信息分开保存在dev_runtime.json中"""
+        runtime_path = os.path.join(os.path.expanduser("~"), ".mgit", "dev_runtime.json")
+        try:
+            with open(runtime_path, 'r', encoding='utf-8') as f:
+                return json.load(f)['launch_time']
+        except (OSError, ValueError, KeyError):
+            # 兼容旧版本启动脚本写入的开发信息文件
+            return dev_info['app'].get('launch_time', '未知')
+
     def updateSystemInfo(self):
         """更新系统信息"""
         info = []
@@ -493,7 +503,7 @@ class Plugin(PluginBase):
                 info.append("<h3>MGit应用</h3>")
                 info.append(f"<p>版本: {dev_info['version']['string']}</p>")
                 info.append(f"<p>构建类型: {dev_info['app']['build_type']}</p>")
-                info.append(f"<p>启动时间: {dev_info['app']['launch_time']}</p>")
+                info.append(f"<p>启动时间: {self._readLaunchTime(dev_info)}</p>")
                 
                 # 路径信息
                 info.append("<h3>路径信息</h3>")
@@ -12,6 +12,8 @@ import re
 import tempfile
 import os
 
+from src.utils.logger import debug, error
+
 class MarkdownHighlighter(QSyntaxHighlighter):
     """ Markdown语法高亮器 - VSCode风格 """
     
@@ -960,7 +962,7 @@ class MarkdownEditor(QWidget):
         """ 保存文件 """
         # 如果没有当前文件路径，执行另存为操作
         if not self.currentFilePath:
-            print("No currentFilePath in saveFile, redirecting to saveAsFile")
+            debug("No currentFilePath in saveFile, redirecting to saveAsFile")
             
             # 尝试从父窗口获取当前文件路径
             parent = self.parent()
@@ -968,7 +970,7 @@ class MarkdownEditor(QWidget):
                 if hasattr(parent, 'statusBar') and hasattr(parent.statusBar, 'getCurrentFile'):
                     status_file = parent.statusBar.getCurrentFile()
                     if status_file:
-                        print(f"Retrieved file path from statusBar: {status_file}")
+                        debug(f"Retrieved file path from statusBar: {status_file}")
                         self.currentFilePath = status_file
                         break
                 parent = parent.parent()
@@ -982,28 +984,28 @@ class MarkdownEditor(QWidget):
             text = self.editor.toPlainText()
             
             # 写入文件
-            print(f"Writing to file: {self.currentFilePath}")
+            debug(f"Writing to file: {self.currentFilePath}")
             with open(self.currentFilePath, 'w', encoding='utf-8') as f:
                 f.write(text)
                 
             # 清除修改标记
             self.editor.document().setModified(False)
-            print("File saved successfully, document marked as unmodified")
+            debug("File saved successfully, document marked as unmodified")
             
             # 通知状态栏（如果有父窗口）
             parent = self.parent()
             while parent:
                 if hasattr(parent, 'statusBar') and hasattr(parent.statusBar, 'setCurrentFile'):
                     parent.statusBar.setCurrentFile(self.currentFilePath)
-                    print(f"Updated statusBar with currentFilePath: {self.currentFilePath}")
+                    debug(f"Updated statusBar with currentFilePath: {self.currentFilePath}")
                     break
                 parent = parent.parent()
             
             return True
         except Exception as e:
             import traceback
-            print(f"Save failed: {str(e)}")
-            print(traceback.format_exc())
+            error(f"Save failed: {str(e)}")
+            error(traceback.format_exc())
             QMessageBox.critical(self, "保存失败", f"保存文件时发生错误: {str(e)}")
             return False
     
@@ -1017,12 +1019,12 @@ class MarkdownEditor(QWidget):
         # 优先检查是否已有当前文件路径
         # 如果是自动保存模式且有当前文件路径，直接使用该路径
         if noninteractive and self.currentFilePath:
-            print(f"Non-interactive save with existing path: {self.currentFilePath}")
+            debug(f"Non-interactive save with existing path: {self.currentFilePath}")
             return self.saveFile()
         
         # 如果是自动保存模式且没有文件路径，则使用临时文件
         if noninteractive and not self.currentFilePath:
-            print("Non-interactive save requested without path")
+            debug("Non-interactive save requested without path")
             
             # 尝试从父窗口获取当前文件路径
             parent = self.parent()
@@ -1031,7 +1033,7 @@ class MarkdownEditor(QWidget):
                     status_file = parent.statusBar.getCurrentFile()
                     if status_file:
                         self.currentFilePath = status_file
-                        print(f"Using path from statusBar: {self.currentFilePath}")
+                        debug(f"Using path from statusBar: {self.currentFilePath}")
                         return self.saveFile()
                 parent = parent.parent()
             
@@ -1043,7 +1045,7 @@ class MarkdownEditor(QWidget):
             save_dir = tempfile.gettempdir()
             filename = "mgit_autosaved_document.md"
             filePath = os.path.join(save_dir, filename)
-            print(f"Auto-saving to temp location: {filePath}")
+            debug(f"Auto-saving to temp location: {filePath}")
         else:
             # 显示文件保存对话框
             filePath, _ = QFileDialog.getSaveFileName(
@@ -1052,7 +1054,7 @@ class MarkdownEditor(QWidget):
             )
         
         if not filePath:
-            print("No file path selected or generated")
+            debug("No file path selected or generated")
             return False  # 用户取消或无法生成路径
             
         # 确保文件有.md扩展名
@@ -1061,7 +1063,7 @@ class MarkdownEditor(QWidget):
             
         # 保存当前文件路径
         self.currentFilePath = filePath
-        print(f"currentFilePath set to: {self.currentFilePath}")
+        debug(f"currentFilePath set to: {self.currentFilePath}")
         
         # 调用保存方法
         return self.saveFile() 
\ No newline at end of file
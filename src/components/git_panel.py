@@ -29,6 +29,14 @@ from src.components.loading_mask import LoadingMask
 from src.components.account_panel import AccountPanel
 from src.components.branch_manager import BranchManagerDialog
 
+def _is_nonempty_dir(path):
+    """ 判断目录是否存在且不为空（最多只读取一个目录项） """
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
 class GitPanel(QWidget):
     """ Git面板组件 """
     
@@ -627,7 +635,7 @@ class GitPanel(QWidget):
         info(f"GitPanel - 完整的仓库路径: {fullRepoPath}")
         
         # 检查路径是否已存在
-        if os.path.exists(fullRepoPath) and os.listdir(fullRepoPath):
+        if _is_nonempty_dir(fullRepoPath):
             reply = QMessageBox.question(
                 self, "确认覆盖", 
                 f"目录 {fullRepoPath} 已存在且不为空，是否继续？\n（不会删除现有文件，但会将此目录初始化为Git仓库）",
@@ -1890,23 +1898,29 @@ class GitPanel(QWidget):
             table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
             table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
             
-            # 填充提交数据
-            for i, commit in enumerate(commits):
-                # 提交ID (短版本)
-                commit_id_item = QTableWidgetItem(commit['hash'][:8])
-                table.setItem(i, 0, commit_id_item)
-                
-                # 作者
-                author_item = QTableWidgetItem(commit['author'])
-                table.setItem(i, 1, author_item)
-                
-                # 日期
-                date_item = QTableWidgetItem(commit['date'])
-                table.setItem(i, 2, date_item)
-                
-                # 提交消息
-                message_item = QTableWidgetItem(commit['message'])
-                table.setItem(i, 3, message_item)
+            # 填充提交数据（填充期间暂停重绘和信号，结束后统一刷新一次）
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+            try:
+                for i, commit in enumerate(commits):
+                    # 提交ID (短版本)
+                    commit_id_item = QTableWidgetItem(commit['hash'][:8])
+                    table.setItem(i, 0, commit_id_item)
+                    
+                    # 作者
+                    author_item = QTableWidgetItem(commit['author'])
+                    table.setItem(i, 1, author_item)
+                    
+                    # 日期
+                    date_item = QTableWidgetItem(commit['date'])
+                    table.setItem(i, 2, date_item)
+                    
+                    # 提交消息
+                    message_item = QTableWidgetItem(commit['message'])
+                    table.setItem(i, 3, message_item)
+            finally:
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
             
             splitter.addWidget(table)
             
@@ -2118,7 +2132,7 @@ class GitPanel(QWidget):
             target_path = os.path.join(target_path, repo_name)
             
         # 如果目标路径已存在，确认是否覆盖
-        if os.path.exists(target_path) and os.listdir(target_path):
+        if _is_nonempty_dir(target_path):
             reply = QMessageBox.question(
                 self, "确认覆盖", 
                 f"目录 {target_path} 已存在且不为空，是否继续？",
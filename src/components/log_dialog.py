@@ -315,6 +315,16 @@ class LogDialog(QDialog):
         
         super().closeEvent(event)
         
+    def reopen(self):
+        """再次打开已创建的对话框时，恢复关闭前的状态并重新加载日志"""
+        self.is_closing = False
+        
+        # 关闭时停止的自动刷新按勾选状态恢复
+        if self.autoRefreshCheck.isChecked():
+            self.toggle_auto_refresh(True)
+        
+        QTimer.singleShot(100, self.load_logs)
+        
     def setup_ui(self):
         """设置UI界面"""
         # 主布局
@@ -4,16 +4,40 @@
 import sys
 import os
 import markdown
+from functools import lru_cache
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QScrollArea
 from PyQt5.QtCore import Qt, QUrl
 from PyQt5.QtWebEngineWidgets import QWebEngineView
 from qfluentwidgets import Theme, isDarkTheme
 
+# Markdown扩展
+_MARKDOWN_EXTENSIONS = (
+    'markdown.extensions.tables',
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.codehilite',
+    'markdown.extensions.toc',
+    'markdown.extensions.attr_list',
+    'markdown.extensions.def_list',
+    'markdown.extensions.abbr',
+    'markdown.extensions.footnotes',
+    'markdown.extensions.md_in_html'
+)
+
+@lru_cache(maxsize=8)
+def _render_markdown(text):
+    """将Markdown文本转换为HTML
+    
+    缓存最近几次的结果，撤销/重做回到之前的内容时无需重新解析
+    """
+    return markdown.markdown(text, extensions=list(_MARKDOWN_EXTENSIONS))
+
 class MarkdownPreview(QWidget):
     """ Markdown预览组件 """
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 上次渲染的 (Markdown文本, 是否深色主题)，两者都未变化时跳过重新渲染
+        self._lastMarkdown = None
         self.initUI()
         
     def initUI(self):
@@ -34,6 +58,13 @@ class MarkdownPreview(QWidget):
         
     def setMarkdown(self, text):
         """ 设置Markdown内容并渲染 """
+        # 内容和主题都与上次渲染相同（如只移动了光标），无需重新渲染；
+        # 样式随主题变化，切换主题后即使文本不变也要重新生成页面
+        key = (text, isDarkTheme())
+        if key == self._lastMarkdown:
+            return
+        self._lastMarkdown = key
+        
         # 转换Markdown为HTML
         html_content = self.convertMarkdownToHtml(text)
         
@@ -63,22 +94,7 @@ class MarkdownPreview(QWidget):
         
     def convertMarkdownToHtml(self, text):
         """ 将Markdown文本转换为HTML """
-        # 定义Markdown扩展
-        extensions = [
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.attr_list',
-            'markdown.extensions.def_list',
-            'markdown.extensions.abbr',
-            'markdown.extensions.footnotes',
-            'markdown.extensions.md_in_html'
-        ]
-        
-        # 转换并返回
-        html = markdown.markdown(text, extensions=extensions)
-        return html
+        return _render_markdown(text)
         
     def getPreviewStyle(self):
         """ 获取预览样式 """
@@ -85,6 +85,11 @@ class StatusBar(QWidget):
         else:
             self.fileLabel.setText("文件: 无")
             
+    def setLoadingFile(self, file_path):
+        """ 显示文件正在加载的提示（不改变当前文件路径） """
+        file_name = os.path.basename(file_path)
+        self.fileLabel.setText(f"文件: 正在加载 {file_name}...")
+            
     def getCurrentFile(self):
         """ 获取当前文件路径 """
         return self.current_file
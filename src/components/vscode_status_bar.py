@@ -22,6 +22,7 @@ class VSCodeStatusBar(QWidget):
     encodingClicked = pyqtSignal()
     eolClicked = pyqtSignal()
     languageClicked = pyqtSignal()
+    visibilityChanged = pyqtSignal(bool)  # 状态栏显示/隐藏
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -124,6 +125,16 @@ class VSCodeStatusBar(QWidget):
         """)
         return button
         
+    def showEvent(self, event):
+        """显示时通知外部恢复状态更新"""
+        super().showEvent(event)
+        self.visibilityChanged.emit(True)
+        
+    def hideEvent(self, event):
+        """隐藏时通知外部暂停状态更新"""
+        super().hideEvent(event)
+        self.visibilityChanged.emit(False)
+        
     def applyTheme(self, dark_mode):
         """应用主题
         
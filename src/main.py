@@ -105,7 +105,8 @@ def main():
     # 设置应用信息
     QCoreApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     QCoreApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
-    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)  # 优化WebEngine性能
+    # 预览组件在QApplication创建后才延迟导入QtWebEngineWidgets，必须预先设置此属性
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     
     # 引用保持，防止GC
     global app, w, translator
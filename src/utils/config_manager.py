@@ -110,9 +110,14 @@ class ConfigManager(QObject):
         # 确保路径是绝对路径
         repo_path = os.path.abspath(repo_path)
         
+        # 已经是最近的第一个仓库时列表不变，无需写入配置和发出信号
+        recent = self.config['recent_repositories']
+        if recent and recent[0] == repo_path:
+            return
+        
         # 如果路径已经在列表中，则移除
-        if repo_path in self.config['recent_repositories']:
-            self.config['recent_repositories'].remove(repo_path)
+        if repo_path in recent:
+            recent.remove(repo_path)
             
         # 添加到列表开头
         self.config['recent_repositories'].insert(0, repo_path)
@@ -194,6 +199,28 @@ class ConfigManager(QObject):
             return 60  # 默认60秒
         return self.config['editor']['auto_save_interval']
     
+    def set_last_open_dir(self, directory):
+        """设置上次打开文件所在的目录
+        Args:
+            directory: 目录路径
+        """
+        if 'editor' not in self.config:
+            self.config['editor'] = {}
+        # 目录未变化时不重复写入配置文件
+        if self.config['editor'].get('last_open_dir') == directory:
+            return
+        self.config['editor']['last_open_dir'] = directory
+        self.save_config()
+        
+    def get_last_open_dir(self):
+        """获取上次打开文件所在的目录
+        Returns:
+            str: 目录路径，没有记录时返回空字符串
+        """
+        if 'editor' not in self.config:
+            return ''
+        return self.config['editor'].get('last_open_dir', '')
+    
     def get_theme(self):
         """获取当前主题设置
         Returns:
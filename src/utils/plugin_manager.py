@@ -8,10 +8,11 @@ import subprocess
 import pkg_resources
 from typing import Dict, List, Any, Type, Optional, Callable, Set
 from pluginbase import PluginBase
+from PyQt5.QtCore import QObject, pyqtSignal
 
 from src.utils.logger import info, warning, error, debug
 
-class PluginManager:
+class PluginManager(QObject):
     """
     插件管理器类 - 负责插件的加载、注册和管理
     
@@ -19,6 +20,9 @@ class PluginManager:
     加载和使用第三方插件，以扩展应用功能，而无需修改核心代码。
     """
     
+    # 定义信号
+    pluginsLoaded = pyqtSignal()  # 插件加载完成信号
+
     # 单例模式
     _instance = None
     
@@ -33,6 +37,7 @@ class PluginManager:
         if self._initialized:
             return
             
+        super().__init__()
         self._initialized = True
         self.app = app  # 应用程序实例
         
@@ -82,13 +87,20 @@ class PluginManager:
         
         info(f"插件管理器初始化完成。系统插件目录: {self.plugin_dir}, 用户插件目录: {self.user_plugin_dir}")
     
+    def list_plugin_names(self) -> List[str]:
+        """获取所有插件名称（不包括以_开头的文件）"""
+        return [name for name in self.plugin_source.list_plugins() 
+                if not name.startswith('_')]
+    
     def load_all_plugins(self) -> None:
-        """加载所有可用的插件"""
+        """
+        加载所有可用的插件
+        
+        插件模块可能在导入时创建Qt对象，必须在主线程中调用
+        """
         info("开始加载所有插件...")
         
-        # 获取所有插件名称（不包括以_开头的文件）
-        plugin_names = [name for name in self.plugin_source.list_plugins() 
-                       if not name.startswith('_')]
+        plugin_names = self.list_plugin_names()
         
         loaded_count = 0
         for plugin_name in plugin_names:
@@ -103,6 +115,7 @@ class PluginManager:
             self._update_requirements_file()
             
         info(f"插件加载完成。成功加载 {loaded_count}/{len(plugin_names)} 个插件")
+        self.pluginsLoaded.emit()
     
     def _check_package_installed(self, package_name: str) -> bool:
         """
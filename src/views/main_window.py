@@ -4,38 +4,168 @@
 import os
 import sys
 import threading
+import traceback
+from collections import defaultdict
+from functools import lru_cache
 from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QSplitter, QMessageBox, 
-                           QStackedWidget, QFileDialog, QMenu, QAction)
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QTimer
+                           QStackedWidget, QFileDialog, QMenu, QAction, QShortcut, QInputDialog, QLineEdit,
+                           QDialog, QDialogButtonBox)
+from PyQt5.QtCore import Qt, QSize, pyqtSignal, QTimer, QThread, QSignalBlocker
 from PyQt5.QtGui import QIcon, QFont, QKeySequence, QColor, QTextCharFormat, QTextCursor
 
 from qfluentwidgets import (NavigationInterface, NavigationItemPosition, 
                           FluentIcon, SubtitleLabel, setTheme, Theme, 
                           FluentStyleSheet, InfoBar, InfoBarPosition, TogglePushButton)
 
-# 导入自定义组件
-from src.components.editor import MarkdownEditor
-from src.components.explorer import FileExplorer
-from src.components.preview import MarkdownPreview
-from src.components.git_panel import GitPanel
-from src.components.status_bar import StatusBar
-from src.utils.git_manager import GitManager
+# 导入自定义组件（界面组件在首次使用处按需导入）
 from src.utils.config_manager import ConfigManager
-from src.components.log_dialog import LogDialog
 from src.utils.logger import info, warning, error, show_error_message, debug, LogCategory
 
 # 导入插件管理器
 from src.utils.plugin_manager import init_plugin_manager, get_plugin_manager
-from src.components.plugin_settings import PluginManager as PluginManagerWidget
+
+@lru_cache(maxsize=32)
+def _read_text(path, mtime):
+    """读取文本文件内容
+    
+    以 (路径, 修改时间) 作为缓存键，文件被修改后旧条目自动失效
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@lru_cache(maxsize=None)
+def _icon(fluent_icon):
+    """获取FluentIcon对应的QIcon，同一图标只创建一次"""
+    return fluent_icon.icon()
+
+@lru_cache(maxsize=1)
+def _resolve_app_icon():
+    """查找应用图标路径，找不到时返回空字符串；结果在首次调用后缓存"""
+    # 尝试获取应用图标路径
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    icon_path = os.path.join(base_dir, 'app.ico')
+    if os.path.exists(icon_path):
+        return icon_path
+    
+    # 也考虑PyInstaller打包环境
+    if hasattr(sys, '_MEIPASS'):
+        icon_path = os.path.join(sys._MEIPASS, 'app.ico')
+        if os.path.exists(icon_path):
+            return icon_path
+    
+    return ''
+
+_APP_ICON = None
+
+def _app_icon():
+    """获取应用图标，首次调用时创建并在之后复用同一个QIcon"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon_path = _resolve_app_icon()
+        if icon_path:
+            _APP_ICON = QIcon(icon_path)
+    return _APP_ICON
+
+# 可在编辑器中打开的文本文件扩展名
+_TEXT_EXTS = frozenset({'.txt', '.md', '.markdown', '.py', '.js', '.html', '.css', '.json', '.xml', '.yml', '.yaml'})
+
+# 超过该大小的文件在后台线程中读取，避免阻塞界面
+ASYNC_READ_THRESHOLD = 64 * 1024
+
+class FileReadWorker(QThread):
+    """文件读取工作线程"""
+    
+    # 定义信号
+    fileRead = pyqtSignal(str, str)
+    readFailed = pyqtSignal(str, str)
+    
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+    
+    def run(self):
+        """执行文件读取"""
+        try:
+            content = _read_text(self.file_path, os.path.getmtime(self.file_path))
+            self.fileRead.emit(self.file_path, content)
+        except Exception as e:
+            self.readFailed.emit(self.file_path, str(e))
+
+def _info_success(parent, title, content, duration=2000, isClosable=True):
+    """在窗口顶部显示成功提示"""
+    InfoBar.success(title=title, content=content, orient=Qt.Horizontal, isClosable=isClosable,
+                    position=InfoBarPosition.TOP, duration=duration, parent=parent)
+
+def _info_warning(parent, title, content, duration=2000, isClosable=True):
+    """在窗口顶部显示警告提示"""
+    InfoBar.warning(title=title, content=content, orient=Qt.Horizontal, isClosable=isClosable,
+                    position=InfoBarPosition.TOP, duration=duration, parent=parent)
+
+def _info_info(parent, title, content, duration=2000, isClosable=True):
+    """在窗口顶部显示普通提示"""
+    InfoBar.info(title=title, content=content, orient=Qt.Horizontal, isClosable=isClosable,
+                 position=InfoBarPosition.TOP, duration=duration, parent=parent)
+
+def _info_error(parent, title, content, duration=3000, isClosable=True):
+    """在窗口顶部显示错误提示"""
+    InfoBar.error(title=title, content=content, orient=Qt.Horizontal, isClosable=isClosable,
+                  position=InfoBarPosition.TOP, duration=duration, parent=parent)
 
 class MainWindow(QMainWindow):
     """ 主窗口类 """
     
     repoChanged = pyqtSignal(str)
     
+    # 菜单动作表：(标题, 图标, 快捷键, 槽函数名)，None 表示分隔符
+    _FILE_ACTIONS = (
+        ("新建文件", FluentIcon.ADD, QKeySequence.New, "createNewFile"),
+        ("打开文件", FluentIcon.FOLDER, QKeySequence.Open, "openFile"),
+        ("保存文件", FluentIcon.SAVE, QKeySequence.Save, "saveFile"),
+        ("另存为", FluentIcon.SAVE_AS, QKeySequence.SaveAs, "saveFileAs"),
+        None,
+        ("打开仓库", FluentIcon.GITHUB, None, "openRepository"),
+        ("克隆仓库", FluentIcon.DOWNLOAD, None, "cloneRepository"),
+    )
+    _EXIT_ACTIONS = (
+        ("退出", FluentIcon.CLOSE, QKeySequence.Quit, "close"),
+    )
+    _UNDO_ACTIONS = (
+        ("撤销", FluentIcon.RETURN, QKeySequence.Undo, "undoEdit"),
+        ("重做", FluentIcon.RETURN, QKeySequence.Redo, "redoEdit"),
+    )
+    _FIND_ACTIONS = (
+        ("查找", FluentIcon.SEARCH, QKeySequence.Find, "showFindDialog"),
+        ("替换", FluentIcon.EDIT, QKeySequence.Replace, "showReplaceDialog"),
+    )
+    _GIT_ACTIONS = (
+        ("提交更改", FluentIcon.ACCEPT, None, "commitChanges"),
+        ("推送更改", FluentIcon.UP, None, "pushChanges"),
+        ("拉取更改", FluentIcon.DOWN, None, "pullChanges"),
+        None,
+        ("管理分支", FluentIcon.FOLDER, None, "manageBranches"),
+        ("查看历史", FluentIcon.HISTORY, None, "viewHistory"),
+    )
+    _PLUGIN_ACTIONS = (
+        ("插件管理器", FluentIcon.SETTING, None, "showPluginManager"),
+        ("刷新插件", FluentIcon.SYNC, None, "refreshPlugins"),
+    )
+    _HELP_ACTIONS = (
+        ("关于", FluentIcon.INFO, None, "showAboutDialog"),
+        ("检查更新", FluentIcon.UPDATE, None, "checkForUpdates"),
+        None,
+        ("开发者工具", FluentIcon.CODE, None, "openDevTools"),
+    )
+    
     def __init__(self):
         super().__init__()
         
+        # 主要组件在initUI中创建，这里先声明以便各方法用 is None 判断
+        self.editor = None
+        self.preview = None
+        self.statusBar = None
+        # 编辑器内部的文本控件，创建编辑器后缓存，避免各处重复探测属性
+        self._editor_ref = None
+        
         # 初始化配置管理器
         self.configManager = ConfigManager()
         
@@ -45,6 +175,28 @@ class MainWindow(QMainWindow):
         # 初始化Git管理器为None
         self.gitManager = None
         
+        # 当前后台读取文件的线程，以及所有尚未结束的读取线程（关闭窗口时等待其结束）
+        self._fileReadWorker = None
+        self._fileReadWorkers = set()
+        
+        # 插件管理对话框和日志对话框，首次打开时创建
+        self._pluginDialog = None
+        self._pluginManagerWidget = None
+        self._logDialog = None
+        
+        # 合并最近仓库列表的连续变更，一批变更只重建一次菜单
+        self._recentMenuTimer = QTimer(self)
+        self._recentMenuTimer.setSingleShot(True)
+        self._recentMenuTimer.setInterval(50)
+        
+        # 合并连续输入，停止输入后再刷新预览和文档导航
+        self._previewTimer = QTimer(self)
+        self._previewTimer.setSingleShot(True)
+        self._previewTimer.setInterval(150)
+        self._navigationTimer = QTimer(self)
+        self._navigationTimer.setSingleShot(True)
+        self._navigationTimer.setInterval(150)
+        
         # 初始化Copilot管理器
         from src.copilot.copilot_manager import CopilotManager
         self.copilotManager = CopilotManager(self.configManager)
@@ -55,16 +207,9 @@ class MainWindow(QMainWindow):
         
         # 设置窗口图标
         try:
-            # 尝试获取应用图标路径
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            icon_path = os.path.join(base_dir, 'app.ico')
-            
-            # 也考虑PyInstaller打包环境
-            if not os.path.exists(icon_path) and hasattr(sys, '_MEIPASS'):
-                icon_path = os.path.join(sys._MEIPASS, 'app.ico')
-            
-            if os.path.exists(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
+            icon = _app_icon()
+            if icon is not None:
+                self.setWindowIcon(icon)
         except Exception as e:
             warning(f"设置窗口图标出错: {str(e)}")
         
@@ -86,26 +231,25 @@ class MainWindow(QMainWindow):
         # 检查自动保存恢复
         QTimer.singleShot(500, self.checkAutoSaveRecovery)
         
-        # 加载插件
-        self._loadPlugins()
+        # 首次绘制后再加载插件，插件导入和初始化不推迟窗口显示
+        QTimer.singleShot(0, self._loadPlugins)
         
     def _loadPlugins(self):
-        """加载插件系统"""
+        """加载插件系统
+        
+        插件可能在导入时创建Qt对象，导入、实例化和初始化都在主线程中完成
+        """
         info("开始加载插件系统...")
         try:
-            # 加载所有插件
+            # 加载所有插件，完成后通过pluginsLoaded信号更新插件菜单
             self.pluginManager.load_all_plugins()
             
             # 触发应用初始化事件，通知插件
             self.pluginManager.trigger_event('app_initialized', self)
             
-            # 更新插件菜单，包括自定义菜单
-            self.updatePluginsMenu()
-            
             info("插件系统加载完成")
         except Exception as e:
             error(f"加载插件系统时出错: {str(e)}")
-            import traceback
             error(traceback.format_exc())
         
     def initUI(self):
@@ -116,10 +260,15 @@ class MainWindow(QMainWindow):
         self.centralLayout = QVBoxLayout(self.centralWidget)
         self.centralLayout.setContentsMargins(0, 0, 0, 0)
         
+        # 构建期间暂停重绘，所有分割器布局完成后只做一次最终布局
+        self.centralWidget.setUpdatesEnabled(False)
+        
         # 创建主分割器
         self.mainSplitter = QSplitter(Qt.Horizontal)
+        self.mainSplitter.blockSignals(True)
         
         # 创建左侧文件浏览器
+        from src.components.explorer import FileExplorer
         self.fileExplorer = FileExplorer(self)
         
         # 创建文档导航器
@@ -133,17 +282,22 @@ class MainWindow(QMainWindow):
         
         # 创建左侧切换分割器
         self.leftSplitter = QSplitter(Qt.Vertical)
+        self.leftSplitter.blockSignals(True)
         self.leftSplitter.addWidget(self.fileExplorer)
         self.leftSplitter.addWidget(self.documentNavigator)
         self.leftSplitter.setSizes([400, 400])
+        self.leftSplitter.blockSignals(False)
         
         leftLayout.addWidget(self.leftSplitter)
         
         # 创建Markdown编辑器（传入配置管理器）
+        from src.components.editor import MarkdownEditor
         self.editor = MarkdownEditor(self, config_manager=self.configManager)
+        self._editor_ref = self.editor.editor
         
-        # 创建Markdown预览面板
-        self.preview = MarkdownPreview(self)
+        # Markdown预览面板（QWebEngineView）启动代价较高，先放置占位控件，
+        # 首次显示窗口后再在空闲时创建，见 _ensurePreview
+        self._previewPlaceholder = QWidget()
         
         # 创建编辑器/预览容器（使用stacked widget替代分屏显示）
         self.editorPreviewContainer = QWidget()
@@ -162,7 +316,7 @@ class MainWindow(QMainWindow):
         
         # 创建预览切换按钮
         self.previewToggleButton = TogglePushButton("预览", self)
-        self.previewToggleButton.setIcon(FluentIcon.VIEW.icon())
+        self.previewToggleButton.setIcon(_icon(FluentIcon.VIEW))
         self.previewToggleButton.setToolTip("切换编辑/预览模式")
         self.previewToggleButton.setChecked(False)  # 默认显示编辑模式
         self.previewToggleButton.clicked.connect(self.toggleEditorPreview)
@@ -173,7 +327,7 @@ class MainWindow(QMainWindow):
         # 创建用于切换视图的QStackedWidget
         self.editorPreviewStack = QStackedWidget()
         self.editorPreviewStack.addWidget(self.editor)   # 索引 0: 编辑器
-        self.editorPreviewStack.addWidget(self.preview)  # 索引 1: 预览
+        self.editorPreviewStack.addWidget(self._previewPlaceholder)  # 索引 1: 预览
         self.editorPreviewStack.setCurrentIndex(0)  # 默认显示编辑器
         
         self.editorPreviewLayout.addWidget(self.editorPreviewStack)
@@ -181,7 +335,12 @@ class MainWindow(QMainWindow):
         # 记录当前视图模式（False: 编辑模式，True: 预览模式）
         self.isPreviewMode = False
         
+        # 隐藏面板前保存的分割器状态，重新显示时恢复
+        self._leftSplitterState = None
+        self._mainSplitterState = None
+        
         # 创建Git面板
+        from src.components.git_panel import GitPanel
         self.gitPanel = GitPanel(self)
         
         # 创建Copilot面板
@@ -195,13 +354,17 @@ class MainWindow(QMainWindow):
         self.mainSplitter.addWidget(self.gitPanel)
         self.mainSplitter.addWidget(self.copilotPanel)
         self.mainSplitter.setSizes([250, 600, 200, 250])
+        self.mainSplitter.blockSignals(False)
         
         # 将主分割器添加到中央布局
         self.centralLayout.addWidget(self.mainSplitter)
         
         # 创建并添加状态栏
+        from src.components.status_bar import StatusBar
         self.statusBar = StatusBar(self)
         self.centralLayout.addWidget(self.statusBar)
+        
+        self.centralWidget.setUpdatesEnabled(True)
     
     def createMenus(self):
         """ 创建菜单栏 """
@@ -210,56 +373,25 @@ class MainWindow(QMainWindow):
         # 文件菜单
         fileMenu = menuBar.addMenu("文件")
         
-        # 新建文件动作
-        newFileAction = QAction("新建文件", self)
-        newFileAction.setIcon(FluentIcon.ADD.icon())
-        newFileAction.setShortcut(QKeySequence.New)
-        newFileAction.triggered.connect(self.createNewFile)
-        fileMenu.addAction(newFileAction)
-        
-        # 打开文件动作
-        openFileAction = QAction("打开文件", self)
-        openFileAction.setIcon(FluentIcon.FOLDER.icon())
-        openFileAction.setShortcut(QKeySequence.Open)
-        openFileAction.triggered.connect(self.openFile)
-        fileMenu.addAction(openFileAction)
-        
-        # 保存文件动作
-        saveFileAction = QAction("保存文件", self)
-        saveFileAction.setIcon(FluentIcon.SAVE.icon())
-        saveFileAction.setShortcut(QKeySequence.Save)
-        saveFileAction.triggered.connect(self.saveFile)
-        fileMenu.addAction(saveFileAction)
-        
-        # 另存为动作
-        saveAsAction = QAction("另存为", self)
-        saveAsAction.setIcon(FluentIcon.SAVE_AS.icon())
-        saveAsAction.setShortcut(QKeySequence.SaveAs)
-        saveAsAction.triggered.connect(self.saveFileAs)
-        fileMenu.addAction(saveAsAction)
-        
-        fileMenu.addSeparator()
-        
-        # 打开仓库动作
-        openRepoAction = QAction("打开仓库", self)
-        openRepoAction.setIcon(FluentIcon.GITHUB.icon())
-        openRepoAction.triggered.connect(self.openRepository)
-        fileMenu.addAction(openRepoAction)
-        
-        # 克隆仓库动作
-        cloneRepoAction = QAction("克隆仓库", self)
-        cloneRepoAction.setIcon(FluentIcon.DOWNLOAD.icon())
-        cloneRepoAction.triggered.connect(self.cloneRepository)
-        fileMenu.addAction(cloneRepoAction)
+        self._addMenuActions(fileMenu, self._FILE_ACTIONS)
         
         # 最近打开的仓库子菜单
         self.recentReposMenu = QMenu("最近的仓库", self)
-        self.recentReposMenu.setIcon(FluentIcon.HISTORY.icon())
+        self.recentReposMenu.setIcon(_icon(FluentIcon.HISTORY))
         fileMenu.addMenu(self.recentReposMenu)
         
+        # 最近仓库动作 {仓库路径: QAction}，更新菜单时复用
+        self._recentActions = {}
+        
+        # 没有最近仓库时的提示信息
+        self._recentEmptyAction = QAction("没有最近打开的仓库", self.recentReposMenu)
+        self._recentEmptyAction.setEnabled(False)
+        self.recentReposMenu.addAction(self._recentEmptyAction)
+        self.recentReposMenu.addSeparator()
+        
         # 清空最近仓库历史
         clearRecentAction = QAction("清空历史记录", self)
-        clearRecentAction.setIcon(FluentIcon.DELETE.icon())
+        clearRecentAction.setIcon(_icon(FluentIcon.DELETE))
         clearRecentAction.triggered.connect(self.clearRecentRepositories)
         self.recentReposMenu.addAction(clearRecentAction)
         
@@ -268,68 +400,39 @@ class MainWindow(QMainWindow):
         
         fileMenu.addSeparator()
         
-        # 退出动作
-        exitAction = QAction("退出", self)
-        exitAction.setIcon(FluentIcon.CLOSE.icon())
-        exitAction.setShortcut(QKeySequence.Quit)
-        exitAction.triggered.connect(self.close)
-        fileMenu.addAction(exitAction)
+        self._addMenuActions(fileMenu, self._EXIT_ACTIONS)
         
         # 编辑菜单
         editMenu = menuBar.addMenu("编辑")
         
-        # 撤销动作
-        undoAction = QAction("撤销", self)
-        undoAction.setIcon(FluentIcon.RETURN.icon())
-        undoAction.setShortcut(QKeySequence.Undo)
-        undoAction.triggered.connect(self.undoEdit)
-        editMenu.addAction(undoAction)
-        
-        # 重做动作
-        redoAction = QAction("重做", self)
-        redoAction.setIcon(FluentIcon.RETURN.icon())
-        redoAction.setShortcut(QKeySequence.Redo)
-        redoAction.triggered.connect(self.redoEdit)
-        editMenu.addAction(redoAction)
+        self._addMenuActions(editMenu, self._UNDO_ACTIONS)
         
         editMenu.addSeparator()
         
         # 剪切动作
         cutAction = QAction("剪切", self)
-        cutAction.setIcon(FluentIcon.CUT.icon())
+        cutAction.setIcon(_icon(FluentIcon.CUT))
         cutAction.setShortcut(QKeySequence.Cut)
-        cutAction.triggered.connect(lambda: self.editor.editor.cut() if hasattr(self, 'editor') else None)
+        cutAction.triggered.connect(self._editor_ref.cut)
         editMenu.addAction(cutAction)
         
         # 复制动作
         copyAction = QAction("复制", self)
-        copyAction.setIcon(FluentIcon.COPY.icon())
+        copyAction.setIcon(_icon(FluentIcon.COPY))
         copyAction.setShortcut(QKeySequence.Copy)
-        copyAction.triggered.connect(lambda: self.editor.editor.copy() if hasattr(self, 'editor') else None)
+        copyAction.triggered.connect(self._editor_ref.copy)
         editMenu.addAction(copyAction)
         
         # 粘贴动作
         pasteAction = QAction("粘贴", self)
-        pasteAction.setIcon(FluentIcon.PASTE.icon())
+        pasteAction.setIcon(_icon(FluentIcon.PASTE))
         pasteAction.setShortcut(QKeySequence.Paste)
-        pasteAction.triggered.connect(lambda: self.editor.editor.paste() if hasattr(self, 'editor') else None)
+        pasteAction.triggered.connect(self._editor_ref.paste)
         editMenu.addAction(pasteAction)
         
         editMenu.addSeparator()
         
-        # 查找动作
-        findAction = QAction("查找", self)
-        findAction.setIcon(FluentIcon.SEARCH.icon())
-        findAction.setShortcut(QKeySequence.Find)
-        findAction.triggered.connect(self.showFindDialog)
-        editMenu.addAction(findAction)
-        
-        # 替换动作
-        replaceAction = QAction("替换", self)
-        replaceAction.setIcon(FluentIcon.EDIT.icon())
-        replaceAction.setShortcut(QKeySequence.Replace)
-        replaceAction.triggered.connect(self.showReplaceDialog)
-        editMenu.addAction(replaceAction)
+        self._addMenuActions(editMenu, self._FIND_ACTIONS)
         
         # 视图菜单
         viewMenu = menuBar.addMenu("视图")
@@ -359,67 +462,35 @@ class MainWindow(QMainWindow):
         
         # 显示日志对话框
         showLogDialogAction = QAction("查看日志", self)
-        showLogDialogAction.setIcon(FluentIcon.DOCUMENT.icon())
+        showLogDialogAction.setIcon(_icon(FluentIcon.DOCUMENT))
         showLogDialogAction.triggered.connect(self.showLogDialog)
         viewMenu.addAction(showLogDialogAction)
         
         # Git菜单
         gitMenu = menuBar.addMenu("Git")
         
-        # 提交更改
-        commitAction = QAction("提交更改", self)
-        commitAction.setIcon(FluentIcon.ACCEPT.icon())
-        commitAction.triggered.connect(self.commitChanges)
-        gitMenu.addAction(commitAction)
-        
-        # 推送更改
-        pushAction = QAction("推送更改", self)
-        pushAction.setIcon(FluentIcon.UP.icon())
-        pushAction.triggered.connect(self.pushChanges)
-        gitMenu.addAction(pushAction)
-        
-        # 拉取更改
-        pullAction = QAction("拉取更改", self)
-        pullAction.setIcon(FluentIcon.DOWN.icon())
-        pullAction.triggered.connect(self.pullChanges)
-        gitMenu.addAction(pullAction)
-        
-        gitMenu.addSeparator()
-        
-        # 管理分支
-        branchesAction = QAction("管理分支", self)
-        branchesAction.setIcon(FluentIcon.FOLDER.icon())
-        branchesAction.triggered.connect(self.manageBranches)
-        gitMenu.addAction(branchesAction)
-        
-        # 查看历史
-        historyAction = QAction("查看历史", self)
-        historyAction.setIcon(FluentIcon.HISTORY.icon())
-        historyAction.triggered.connect(self.viewHistory)
-        gitMenu.addAction(historyAction)
+        self._addMenuActions(gitMenu, self._GIT_ACTIONS)
         
         # 插件菜单
         pluginsMenu = menuBar.addMenu("插件")
         
-        # 插件管理器
-        managePluginsAction = QAction("插件管理器", self)
-        managePluginsAction.setIcon(FluentIcon.SETTING.icon())
-        managePluginsAction.triggered.connect(self.showPluginManager)
-        pluginsMenu.addAction(managePluginsAction)
-        
-        # 刷新插件动作
-        refreshPluginsAction = QAction("刷新插件", self)
-        refreshPluginsAction.setIcon(FluentIcon.SYNC.icon())
-        refreshPluginsAction.triggered.connect(self.refreshPlugins)
-        pluginsMenu.addAction(refreshPluginsAction)
+        self._addMenuActions(pluginsMenu, self._PLUGIN_ACTIONS)
         
         pluginsMenu.addSeparator()
         
         # 插件子菜单 - 将在插件加载后更新
         self.pluginsSubMenu = QMenu("已安装插件", self)
-        self.pluginsSubMenu.setIcon(FluentIcon.LIBRARY.icon())
+        self.pluginsSubMenu.setIcon(_icon(FluentIcon.LIBRARY))
         pluginsMenu.addMenu(self.pluginsSubMenu)
         
+        # 插件动作 {插件名: QAction} 与类型子菜单 {插件类型: QMenu}，更新菜单时复用
+        self._pluginActions = {}
+        self._pluginTypeMenus = {}
+        self._noPluginsAction = QAction("未安装插件", self.pluginsSubMenu)
+        self._noPluginsAction.setEnabled(False)
+        self.pluginsSubMenu.addAction(self._noPluginsAction)
+        self.pluginManager.pluginsLoaded.connect(self.updatePluginsMenu)
+        
         # Copilot菜单
         copilotMenu = menuBar.addMenu("Copilot")
         
@@ -427,7 +498,7 @@ class MainWindow(QMainWindow):
         self.toggleCopilotPanelAction = QAction("显示Copilot面板", self)
         self.toggleCopilotPanelAction.setCheckable(True)
         self.toggleCopilotPanelAction.setChecked(False)
-        self.toggleCopilotPanelAction.setIcon(FluentIcon.ROBOT.icon())
+        self.toggleCopilotPanelAction.setIcon(_icon(FluentIcon.ROBOT))
         self.toggleCopilotPanelAction.triggered.connect(self.toggleCopilotPanel)
         copilotMenu.addAction(self.toggleCopilotPanelAction)
         
@@ -455,7 +526,7 @@ class MainWindow(QMainWindow):
         
         # Copilot设置
         copilotSettingsAction = QAction("Copilot设置", self)
-        copilotSettingsAction.setIcon(FluentIcon.SETTING.icon())
+        copilotSettingsAction.setIcon(_icon(FluentIcon.SETTING))
         copilotSettingsAction.triggered.connect(self.showCopilotSettings)
         copilotMenu.addAction(copilotSettingsAction)
         
@@ -474,45 +545,59 @@ class MainWindow(QMainWindow):
         )
         autoSaveMenu.addAction(self.autoSaveOnFocusAction)
         
-        # 自动保存间隔选择
-        autoSaveIntervalMenu = QMenu("自动保存间隔", self)
-        
-        # 添加不同的自动保存间隔选项
-        for seconds in [30, 60, 120, 300, 600]:
-            intervalAction = QAction(f"{seconds//60}分钟" if seconds >= 60 else f"{seconds}秒", self)
-            intervalAction.setCheckable(True)
-            intervalAction.setChecked(self.configManager.get_auto_save_interval() == seconds)
-            intervalAction.triggered.connect(
-                lambda checked, s=seconds: self.configManager.set_auto_save_interval(s)
-            )
-            autoSaveIntervalMenu.addAction(intervalAction)
-            
-        autoSaveMenu.addMenu(autoSaveIntervalMenu)
+        # 自动保存间隔选择（选项在首次展开时创建）
+        self.autoSaveIntervalMenu = QMenu("自动保存间隔", self)
+        self._autoSaveIntervalBuilt = False
+        self.autoSaveIntervalMenu.aboutToShow.connect(self._populateAutoSaveInterval)
+        autoSaveMenu.addMenu(self.autoSaveIntervalMenu)
         
         settingsMenu.addMenu(autoSaveMenu)
         
         # 帮助菜单
         helpMenu = menuBar.addMenu("帮助")
         
-        # 关于
-        aboutAction = QAction("关于", self)
-        aboutAction.setIcon(FluentIcon.INFO.icon())
-        aboutAction.triggered.connect(self.showAboutDialog)
-        helpMenu.addAction(aboutAction)
-        
-        # 检查更新
-        checkUpdateAction = QAction("检查更新", self)
-        checkUpdateAction.setIcon(FluentIcon.UPDATE.icon())
-        checkUpdateAction.triggered.connect(self.checkForUpdates)
-        helpMenu.addAction(checkUpdateAction)
-        
-        helpMenu.addSeparator()
-        
-        # 开发者工具
-        devToolsAction = QAction("开发者工具", self)
-        devToolsAction.setIcon(FluentIcon.CODE.icon())
-        devToolsAction.triggered.connect(self.openDevTools)
-        helpMenu.addAction(devToolsAction)
+        self._addMenuActions(helpMenu, self._HELP_ACTIONS)
+    
+    def _addMenuActions(self, menu, entries):
+        """按动作表向菜单添加动作
+        
+        Args:
+            menu: 目标菜单
+            entries: (标题, 图标, 快捷键, 槽函数名) 元组序列，None 表示分隔符
+        """
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            title, icon, shortcut, slot = entry
+            action = QAction(title, self)
+            action.setIcon(_icon(icon))
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(self, slot))
+            menu.addAction(action)
+
+    def _populateAutoSaveInterval(self):
+        """首次展开时创建自动保存间隔选项"""
+        if self._autoSaveIntervalBuilt:
+            return
+        self._autoSaveIntervalBuilt = True
+        
+        # 添加不同的自动保存间隔选项
+        current_interval = self.configManager.get_auto_save_interval()
+        for seconds in [30, 60, 120, 300, 600]:
+            intervalAction = QAction(f"{seconds//60}分钟" if seconds >= 60 else f"{seconds}秒", self)
+            intervalAction.setCheckable(True)
+            intervalAction.setChecked(current_interval == seconds)
+            intervalAction.setData(seconds)
+            intervalAction.triggered.connect(self._onAutoSaveIntervalTriggered)
+            self.autoSaveIntervalMenu.addAction(intervalAction)
+    
+    def _onAutoSaveIntervalTriggered(self):
+        """自动保存间隔选项被点击，保存对应的间隔"""
+        action = self.sender()
+        if action is not None:
+            self.configManager.set_auto_save_interval(action.data())
     
     def _setupPluginMenus(self, menuBar):
         """设置插件菜单项
@@ -524,50 +609,72 @@ class MainWindow(QMainWindow):
         pass
     
     def updatePluginsMenu(self):
-        """更新插件菜单"""
-        # 清空现有菜单项
-        self.pluginsSubMenu.clear()
+        """更新插件菜单
         
+        复用已创建的类型子菜单和插件动作，只刷新勾选状态；
+        仅为新插件创建动作，并移除已卸载插件的动作
+        """
         # 获取所有可用插件
         plugins_info = self.pluginManager.plugin_info
+        is_enabled = self.configManager.is_plugin_enabled
         
         # 按类型组织
-        plugins_by_type = {}
+        plugins_by_type = defaultdict(list)
         for plugin_name, plugin_info in plugins_info.items():
-            plugin_type = plugin_info.get('plugin_type', '通用')
-            if plugin_type not in plugins_by_type:
-                plugins_by_type[plugin_type] = []
-            plugins_by_type[plugin_type].append((plugin_name, plugin_info))
+            plugins_by_type[plugin_info.get('plugin_type', '通用')].append((plugin_name, plugin_info))
         
-        # 为每种类型创建子菜单
+        # 移除已卸载插件的动作
+        for plugin_name in [name for name in self._pluginActions if name not in plugins_info]:
+            plugin_action = self._pluginActions.pop(plugin_name)
+            plugin_action.parent().removeAction(plugin_action)
+            plugin_action.deleteLater()
+        
+        # 为每种类型创建（或复用）子菜单
         for plugin_type, plugins in plugins_by_type.items():
-            type_menu = QMenu(plugin_type, self)
+            type_menu = self._pluginTypeMenus.get(plugin_type)
+            if type_menu is None:
+                type_menu = QMenu(plugin_type, self.pluginsSubMenu)
+                self.pluginsSubMenu.addMenu(type_menu)
+                self._pluginTypeMenus[plugin_type] = type_menu
             
             for plugin_name, plugin_info in plugins:
-                # 创建插件动作
-                plugin_action = QAction(plugin_info['name'], self)
-                enabled = self.configManager.is_plugin_enabled(plugin_name)
-                plugin_action.setCheckable(True)
-                plugin_action.setChecked(enabled)
+                plugin_action = self._pluginActions.get(plugin_name)
                 
-                # 连接到启用/禁用函数
-                plugin_action.triggered.connect(
-                    lambda checked, name=plugin_name: self.togglePlugin(name, checked)
-                )
+                # 插件类型发生变化时，在新的子菜单中重新创建动作
+                if plugin_action is not None and plugin_action.parent() is not type_menu:
+                    plugin_action.parent().removeAction(plugin_action)
+                    plugin_action.deleteLater()
+                    plugin_action = None
                 
-                type_menu.addAction(plugin_action)
-            
-            self.pluginsSubMenu.addMenu(type_menu)
+                if plugin_action is None:
+                    # 创建插件动作，通过data记录插件名称，统一连接到启用/禁用函数
+                    plugin_action = QAction(plugin_info['name'], type_menu)
+                    plugin_action.setCheckable(True)
+                    plugin_action.setData(plugin_name)
+                    plugin_action.triggered.connect(self._onPluginActionTriggered)
+                    type_menu.addAction(plugin_action)
+                    self._pluginActions[plugin_name] = plugin_action
+                
+                plugin_action.setChecked(is_enabled(plugin_name))
         
-        # 如果没有插件，添加一个禁用的项目
-        if not plugins_info:
-            no_plugins_action = QAction("未安装插件", self)
-            no_plugins_action.setEnabled(False)
-            self.pluginsSubMenu.addAction(no_plugins_action)
+        # 移除已没有插件的类型子菜单
+        for plugin_type in [t for t in self._pluginTypeMenus if t not in plugins_by_type]:
+            type_menu = self._pluginTypeMenus.pop(plugin_type)
+            self.pluginsSubMenu.removeAction(type_menu.menuAction())
+            type_menu.deleteLater()
+        
+        # 如果没有插件，显示一个禁用的项目
+        self._noPluginsAction.setVisible(not plugins_info)
             
         # 更新插件自定义菜单项
         self.updatePluginCustomMenus()
     
+    def _onPluginActionTriggered(self, checked):
+        """插件菜单项被点击，切换对应插件的启用状态"""
+        action = self.sender()
+        if action is not None:
+            self.togglePlugin(action.data(), checked)
+    
     def updatePluginCustomMenus(self):
         """更新插件自定义菜单项"""
         menuBar = self.menuBar()
@@ -608,7 +715,6 @@ class MainWindow(QMainWindow):
                         icon = item.get('icon')
                         if icon:
                             if isinstance(icon, str):
-                                from qfluentwidgets import FluentIcon
                                 # 替换getIconByName函数，使用自定义方法获取图标
                                 icon_map = {
                                     'text_description': FluentIcon.DOCUMENT,
@@ -622,7 +728,7 @@ class MainWindow(QMainWindow):
                                 }
                                 # 获取对应的FluentIcon或默认为DOCUMENT
                                 fluent_icon = icon_map.get(icon, FluentIcon.DOCUMENT)
-                                action.setIcon(fluent_icon.icon())
+                                action.setIcon(_icon(fluent_icon))
                             else:
                                 action.setIcon(icon)
                         
@@ -650,7 +756,6 @@ class MainWindow(QMainWindow):
                     menu_action.setObjectName(f"plugin_menu_action_{plugin_name}")
                     
                 except Exception as e:
-                    from src.utils.logger import error
                     error(f"加载插件 '{plugin_name}' 的自定义菜单失败: {str(e)}")
     
     def togglePlugin(self, plugin_name, enabled):
@@ -675,21 +780,30 @@ class MainWindow(QMainWindow):
                 
                 # 提示成功
                 action_text = "启用" if enabled else "禁用"
-                InfoBar.success(
-                    title=f"插件已{action_text}",
-                    content=f"插件 '{plugin_name}' 已成功{action_text}",
-                    orient=Qt.Horizontal,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                _info_success(self, f"插件已{action_text}", f"插件 '{plugin_name}' 已成功{action_text}",
+                              isClosable=False)
         except Exception as e:
             error(f"切换插件 '{plugin_name}' 状态失败: {str(e)}")
     
     def showPluginManager(self):
-        """显示插件管理界面"""
-        # 创建插件管理对话框
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QDialogButtonBox
+        """显示插件管理界面
+        
+        对话框在首次打开时创建，之后复用并只刷新插件列表
+        """
+        if self._pluginDialog is None:
+            self._pluginDialog = self._buildPluginDialog()
+        else:
+            self._pluginManagerWidget.loadPlugins()
+        
+        # 显示对话框
+        self._pluginDialog.exec_()
+        
+        # 更新插件菜单
+        self.updatePluginsMenu()
+    
+    def _buildPluginDialog(self):
+        """创建插件管理对话框"""
+        from src.components.plugin_settings import PluginManager as PluginManagerWidget
         
         dialog = QDialog(self)
         dialog.setWindowTitle("插件管理")
@@ -698,84 +812,72 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(dialog)
         
         # 创建插件管理器界面
-        plugin_manager_widget = PluginManagerWidget(dialog)
-        layout.addWidget(plugin_manager_widget)
+        self._pluginManagerWidget = PluginManagerWidget(dialog)
+        layout.addWidget(self._pluginManagerWidget)
         
         # 添加关闭按钮
         button_box = QDialogButtonBox(QDialogButtonBox.Close)
         button_box.rejected.connect(dialog.reject)
         layout.addWidget(button_box)
         
-        # 显示对话框
-        dialog.exec_()
-        
-        # 更新插件菜单
-        self.updatePluginsMenu()
+        return dialog
     
     def refreshPlugins(self):
         """刷新插件"""
         try:
-            # 重新加载所有插件
+            # 重新加载所有插件，插件菜单由pluginsLoaded信号更新
             self.pluginManager.load_all_plugins()
             
-            # 更新插件菜单，包括自定义菜单
-            self.updatePluginsMenu()
-            
             # 提示成功
-            InfoBar.success(
-                title="插件已刷新",
-                content="已重新加载所有可用插件",
-                orient=Qt.Horizontal,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            _info_success(self, "插件已刷新", "已重新加载所有可用插件", isClosable=False)
         except Exception as e:
             error(f"刷新插件失败: {str(e)}")
             
             # 提示错误
-            InfoBar.error(
-                title="刷新插件失败",
-                content=f"刷新插件时出错: {str(e)}",
-                orient=Qt.Horizontal,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=self
-            )
+            _info_error(self, "刷新插件失败", f"刷新插件时出错: {str(e)}", isClosable=False)
             
     def updateRecentRepositoriesMenu(self):
-        """ 更新最近仓库菜单 """
-        # 清空除了最后一项（清空历史记录）外的所有菜单项
-        clearAction = None
-        if self.recentReposMenu.actions():
-            clearAction = self.recentReposMenu.actions()[-1]
-            
-        self.recentReposMenu.clear()
+        """ 更新最近仓库菜单
+        
+        复用已有的菜单项，只为新增的仓库创建动作，并移除已不在列表中的动作
+        """
+        menu = self.recentReposMenu
         
         # 获取最近仓库列表
         recentRepos = self.configManager.get_recent_repositories()
         
-        # 添加最近仓库到菜单
-        for repo in recentRepos:
-            repoName = os.path.basename(repo)
-            action = QAction(f"{repoName} ({repo})", self)
-            action.triggered.connect(lambda checked, path=repo: self.openRepository(path))
-            self.recentReposMenu.addAction(action)
-        
-        # 如果没有最近仓库，添加提示信息
-        if not recentRepos:
-            emptyAction = QAction("没有最近打开的仓库", self)
-            emptyAction.setEnabled(False)
-            self.recentReposMenu.addAction(emptyAction)
+        # 没有最近仓库时显示提示信息
+        self._recentEmptyAction.setVisible(not recentRepos)
+        
+        if list(self._recentActions) == recentRepos:
+            return
             
-        # 添加分隔符和清空历史记录动作
-        self.recentReposMenu.addSeparator()
-        if clearAction:
-            self.recentReposMenu.addAction(clearAction)
-        else:
-            clearRecentAction = QAction("清空历史记录", self)
-            clearRecentAction.triggered.connect(self.clearRecentRepositories)
-            self.recentReposMenu.addAction(clearRecentAction)
+        # 移除已不在列表中的仓库
+        keep = set(recentRepos)
+        for path in [p for p in self._recentActions if p not in keep]:
+            action = self._recentActions.pop(path)
+            menu.removeAction(action)
+            action.deleteLater()
+            
+        # 按最新顺序排列仓库动作，插入到提示信息之前
+        actions = {}
+        for repo in recentRepos:
+            action = self._recentActions.get(repo)
+            if action is None:
+                action = QAction(f"{os.path.basename(repo)} ({repo})", menu)
+                action.setData(repo)
+                action.triggered.connect(self._openRecentRepository)
+            else:
+                menu.removeAction(action)
+            menu.insertAction(self._recentEmptyAction, action)
+            actions[repo] = action
+        self._recentActions = actions
+        
+    def _openRecentRepository(self, checked=False):
+        """ 打开最近仓库菜单项对应的仓库 """
+        action = self.sender()
+        if action is not None:
+            self.openRepository(action.data())
         
     def clearRecentRepositories(self):
         """ 清空最近仓库历史记录 """
@@ -790,61 +892,125 @@ class MainWindow(QMainWindow):
             self.configManager.clear_recent_repositories()
             # 不需要手动调用updateRecentRepositoriesMenu，信号连接会自动触发更新
             
-            InfoBar.success(
-                title="清空成功",
-                content="已清空最近仓库历史记录",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            _info_success(self, "清空成功", "已清空最近仓库历史记录")
     
     def connectSignals(self):
-        """ 连接信号与槽 """
-        # 编辑器内容改变时，更新预览
-        self.editor.textChanged.connect(self.updatePreview)
+        """ 连接信号与槽
         
-        # 编辑器文档内容变化时，更新导航
-        self.editor.documentChanged.connect(self.updateDocumentNavigation)
+        使用唯一连接，即使被重复调用也不会产生重复的槽调用
+        """
+        connect = self._connectUnique
+        
+        # 编辑器内容改变时，经定时器合并后更新预览
+        connect(self.editor.textChanged, self._previewTimer.start)
+        connect(self._previewTimer.timeout, self.updatePreview)
+        
+        # 编辑器文档内容变化时，经定时器合并后更新导航
+        connect(self.editor.documentChanged, self._scheduleDocumentNavigation)
+        connect(self._navigationTimer.timeout, self._refreshDocumentNavigation)
         
         # 编辑器光标位置变化时，更新导航中的当前项
-        self.editor.cursorPositionChanged.connect(self.onCursorPositionChanged)
+        connect(self.editor.cursorPositionChanged, self.onCursorPositionChanged)
         
         # 导航项被点击时，将编辑器跳转到对应位置
-        self.documentNavigator.headingSelected.connect(self.editor.goToLine)
+        connect(self.documentNavigator.headingSelected, self.editor.goToLine)
         
         # 文件浏览器选择文件时，加载文件
-        self.fileExplorer.fileSelected.connect(self.loadFile)
+        connect(self.fileExplorer.fileSelected, self.loadFile)
         
         # 仓库改变时，通知各组件
-        self.repoChanged.connect(self.fileExplorer.setRootPath)
-        self.repoChanged.connect(self.gitPanel.setRepository)
+        connect(self.repoChanged, self.fileExplorer.setRootPath)
+        connect(self.repoChanged, self.gitPanel.setRepository)
         
         # 连接GitPanel的信号
-        self.gitPanel.repositoryInitialized.connect(self.onRepositoryInitialized)
-        self.gitPanel.repositoryOpened.connect(self.onRepositoryOpened)
+        connect(self.gitPanel.repositoryInitialized, self.onRepositoryInitialized)
+        connect(self.gitPanel.repositoryOpened, self.onRepositoryOpened)
         
-        # 连接ConfigManager的仓库列表更新信号，实时更新菜单
-        self.configManager.recentRepositoriesChanged.connect(self.updateRecentRepositoriesMenu)
+        # 连接ConfigManager的仓库列表更新信号，经定时器合并后更新菜单
+        connect(self.configManager.recentRepositoriesChanged, self._recentMenuTimer.start)
+        connect(self._recentMenuTimer.timeout, self.updateRecentRepositoriesMenu)
         # 同时也通知Git面板更新最近仓库列表
-        self.configManager.recentRepositoriesChanged.connect(self.gitPanel.updateRecentRepositories)
+        connect(self._recentMenuTimer.timeout, self.gitPanel.updateRecentRepositories)
+        
+    @staticmethod
+    def _connectUnique(signal, slot):
+        """ 以Qt.UniqueConnection方式连接信号，已存在相同连接时忽略
+        
+        只忽略重复连接；签名不匹配、接收者已删除等其他错误照常抛出
+        """
+        try:
+            signal.connect(slot, Qt.UniqueConnection)
+        except TypeError as e:
+            # 重复连接时QObject::connect返回false，PyQt报告为"connect() failed between ..."
+            if "connect() failed" not in str(e):
+                raise
+            debug(f"忽略重复的信号连接: {e}", category=LogCategory.UI)
+        
+    def showEvent(self, event):
+        """ 窗口首次显示后，在空闲时创建预览面板 """
+        super().showEvent(event)
+        if self.preview is None:
+            QTimer.singleShot(0, self._ensurePreview)
+    
+    def _ensurePreview(self):
+        """ 确保预览面板已创建，并替换掉占位控件
         
+        Returns:
+            MarkdownPreview: 预览面板
+        """
+        if self.preview is None:
+            from src.components.preview import MarkdownPreview
+            self.preview = MarkdownPreview(self)
+            
+            # 用真正的预览面板替换占位控件，保持索引 1 不变
+            current = self.editorPreviewStack.currentIndex()
+            self.editorPreviewStack.removeWidget(self._previewPlaceholder)
+            self.editorPreviewStack.insertWidget(1, self.preview)
+            self.editorPreviewStack.setCurrentIndex(current)
+            self._previewPlaceholder.deleteLater()
+            self._previewPlaceholder = None
+            
+            # 渲染创建前已有的内容
+            self.updatePreview()
+        return self.preview
+    
     def updatePreview(self):
         """ 更新Markdown预览 """
+        # 预览面板尚未创建，创建时会渲染当前内容
+        if self.preview is None:
+            return
         content = self.editor.toPlainText()
         self.preview.setMarkdown(content)
     
     def createNewFile(self):
         """ 创建新文件 """
         # 这里可以实现新建文件的逻辑
-        self.editor.clearText()
+        blocker = QSignalBlocker(self.editor)
+        try:
+            self.editor.clearText()
+        finally:
+            blocker.unblock()
+        self._onEditorContentReplaced()
         self.statusBar.setCurrentFile("")
     
+    def _onEditorContentReplaced(self):
+        """ 编辑器内容被整体替换后统一刷新一次
+        
+        整体替换期间编辑器信号被屏蔽，中间状态不会触发预览渲染和导航解析；
+        替换完成后通知其他监听者（如插件），并直接刷新预览和导航
+        """
+        self.editor.textChanged.emit()
+        self._previewTimer.stop()
+        self._navigationTimer.stop()
+        self.updatePreview()
+        self._refreshDocumentNavigation()
+    
     def openFile(self):
         """ 打开文件对话框 """
+        # 从上次打开文件的目录开始，避免对话框每次重新枚举默认目录
+        startDir = self.configManager.get_last_open_dir() or os.path.expanduser("~")
         filePath, _ = QFileDialog.getOpenFileName(
-            self, "打开Markdown文件", "", "Markdown Files (*.md *.markdown);;All Files (*)"
+            self, "打开Markdown文件", startDir, "Markdown Files (*.md *.markdown);;All Files (*)"
         )
         if filePath:
             self.loadFile(filePath)
@@ -858,39 +1024,30 @@ class MainWindow(QMainWindow):
         
         # 如果没有当前文件，执行另存为操作
         if not currentFile:
-            print("MainWindow.saveFile: No current file, trying saveFileAs")
+            debug("MainWindow.saveFile: No current file, trying saveFileAs")
             return self.saveFileAs()
             
         try:
             # 设置编辑器当前文件路径
-            print(f"MainWindow.saveFile: Setting editor.currentFilePath to {currentFile}")
+            debug(f"MainWindow.saveFile: Setting editor.currentFilePath to {currentFile}")
             self.editor.currentFilePath = currentFile
             
             # 使用编辑器的保存方法
-            print("MainWindow.saveFile: Calling editor.saveFile()")
+            debug("MainWindow.saveFile: Calling editor.saveFile()")
             success = self.editor.saveFile()
             
             if success:
                 # 更新状态栏
                 self.statusBar.setCurrentFile(currentFile)
-                print(f"MainWindow.saveFile: Updated statusBar with {currentFile}")
+                debug(f"MainWindow.saveFile: Updated statusBar with {currentFile}")
                 
                 # 显示成功消息
-                InfoBar.success(
-                    title="保存成功",
-                    content=f"文件已保存: {os.path.basename(currentFile)}",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                _info_success(self, "保存成功", f"文件已保存: {os.path.basename(currentFile)}")
             
             return success
         except Exception as e:
-            import traceback
-            print(f"MainWindow.saveFile failed: {str(e)}")
-            print(traceback.format_exc())
+            error(f"MainWindow.saveFile failed: {str(e)}")
+            error(traceback.format_exc())
             show_error_message(self, "保存失败", "保存文件时发生错误", e)
             return False
             
@@ -900,33 +1057,25 @@ class MainWindow(QMainWindow):
             bool: 是否成功保存
         """
         currentFile = self.statusBar.getCurrentFile()
-        print(f"MainWindow.saveFileAs: Current file is {currentFile}")
+        debug(f"MainWindow.saveFileAs: Current file is {currentFile}")
         
         # 设置起始目录
         if currentFile:
             self.editor.currentFilePath = currentFile
-            print(f"MainWindow.saveFileAs: Set editor.currentFilePath to {currentFile}")
+            debug(f"MainWindow.saveFileAs: Set editor.currentFilePath to {currentFile}")
         
         # 使用编辑器的另存为方法
-        print("MainWindow.saveFileAs: Calling editor.saveAsFile()")
+        debug("MainWindow.saveFileAs: Calling editor.saveAsFile()")
         success = self.editor.saveAsFile()
         
         if success and self.editor.currentFilePath:
             # 更新状态栏
             newPath = self.editor.currentFilePath
             self.statusBar.setCurrentFile(newPath)
-            print(f"MainWindow.saveFileAs: Updated statusBar with new path: {newPath}")
+            debug(f"MainWindow.saveFileAs: Updated statusBar with new path: {newPath}")
             
             # 显示成功消息
-            InfoBar.success(
-                title="保存成功",
-                content=f"文件已保存: {os.path.basename(newPath)}",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            _info_success(self, "保存成功", f"文件已保存: {os.path.basename(newPath)}")
             
         return success
     
@@ -934,6 +1083,7 @@ class MainWindow(QMainWindow):
         """ 打开Git仓库 """
         # 检查是否为有效的Git仓库
         try:
+            from src.utils.git_manager import GitManager
             gitManager = GitManager(path)
             if gitManager.isValidRepo():
                 self.repoChanged.emit(path)
@@ -945,15 +1095,7 @@ class MainWindow(QMainWindow):
                 
                 return True
             else:
-                InfoBar.warning(
-                    title="无效仓库",
-                    content="所选路径不是有效的Git仓库",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                _info_warning(self, "无效仓库", "所选路径不是有效的Git仓库")
                 return False
         except Exception as e:
             QMessageBox.critical(self, "错误", f"打开仓库失败: {str(e)}")
@@ -970,16 +1112,7 @@ class MainWindow(QMainWindow):
     
     def onRepositoryOpened(self, repo_path):
         """ 处理仓库打开事件 """
-        # 简单的防止重复更新的逻辑
-        # 检查这个仓库是否已经是最近的第一个仓库
-        recent_repos = self.configManager.get_recent_repositories()
-        if recent_repos and recent_repos[0] == repo_path:
-            # 如果已经是最近的第一个仓库，只更新UI即可，不需要触发一次完整的添加流程
-            self.repoChanged.emit(repo_path)
-            self.statusBar.setCurrentRepository(repo_path)
-            return
-            
-        # 添加到最近仓库列表并更新UI
+        # 添加到最近仓库列表（已是第一个仓库时不会重复写入）
         self.configManager.add_recent_repository(repo_path)
         # 不需要手动调用updateRecentRepositoriesMenu，信号连接会自动触发更新
         
@@ -998,22 +1131,19 @@ class MainWindow(QMainWindow):
 
     def checkAutoSaveRecovery(self):
         """ 检查是否有自动保存文件需要恢复 """
-        if hasattr(self, 'editor') and hasattr(self.editor, 'recoverFromAutoSave'):
-            recovered = self.editor.recoverFromAutoSave()
+        if self.editor is not None:
+            blocker = QSignalBlocker(self.editor)
+            try:
+                recovered = self.editor.recoverFromAutoSave()
+            finally:
+                blocker.unblock()
             if recovered:
-                InfoBar.success(
-                    title="恢复成功",
-                    content="已从自动保存文件恢复内容",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=3000,
-                    parent=self
-                ) 
+                self._onEditorContentReplaced()
+                _info_success(self, "恢复成功", "已从自动保存文件恢复内容", 3000) 
 
     def closeEvent(self, event):
         """ 在关闭窗口前检查是否有未保存的更改 """
-        if hasattr(self, 'editor') and hasattr(self.editor, 'editor') and self.editor.editor.document().isModified():
+        if self._editor_ref is not None and self._editor_ref.document().isModified():
             reply = QMessageBox.question(
                 self, "保存更改", 
                 "文档有未保存的更改，是否保存？",
@@ -1033,31 +1163,43 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
         
-        # 停止自动保存定时器
-        if hasattr(self, 'editor') and hasattr(self.editor, 'autoSaveTimer'):
-            self.editor.autoSaveTimer.stop()
+        editor = self.editor
+        if editor is not None:
+            # 停止自动保存定时器
+            timer = getattr(editor, 'autoSaveTimer', None)
+            if timer is not None:
+                timer.stop()
             
-        # 移除自动保存文件
-        if hasattr(self, 'editor') and hasattr(self.editor, 'autoSavePath'):
-            try:
-                import os
-                if os.path.exists(self.editor.autoSavePath):
-                    os.remove(self.editor.autoSavePath)
-            except:
-                pass
+            # 移除自动保存文件（文件不存在时直接忽略）
+            path = getattr(editor, 'autoSavePath', None)
+            if path:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+        
+        # 忽略尚未返回的读取结果，并等待读取线程结束，避免销毁仍在运行的QThread
+        self._fileReadWorker = None
+        for worker in list(self._fileReadWorkers):
+            worker.wait()
         
         # 接受关闭事件
         event.accept() 
 
     def showLogDialog(self):
-        """ 显示日志管理对话框 """
-        dialog = LogDialog(self)
-        dialog.exec_() 
+        """ 显示日志管理对话框
+        
+        对话框在首次打开时创建，之后复用并重新加载日志
+        """
+        if self._logDialog is None:
+            from src.components.log_dialog import LogDialog
+            self._logDialog = LogDialog(self)
+        else:
+            self._logDialog.reopen()
+        self._logDialog.exec_()
 
     def setupShortcuts(self):
         """ 设置全局快捷键 """
-        from PyQt5.QtWidgets import QShortcut
-        
         # 保存快捷键
         saveShortcut = QShortcut(QKeySequence("Ctrl+S"), self)
         saveShortcut.activated.connect(self.saveFile)
@@ -1068,8 +1210,6 @@ class MainWindow(QMainWindow):
 
     def showAboutDialog(self):
         """ 显示关于对话框 """
-        from PyQt5.QtWidgets import QMessageBox
-        
         QMessageBox.about(
             self,
             "关于 MGit",
@@ -1081,127 +1221,110 @@ class MainWindow(QMainWindow):
 
     def openRepositoryDialog(self):
         """打开仓库对话框"""
-        from PyQt5.QtWidgets import QFileDialog
-        
         dir_path = QFileDialog.getExistingDirectory(self, "选择Git仓库目录")
         if dir_path:
             self.openRepository(dir_path)
             
     def undoEdit(self):
         """撤销编辑操作"""
-        if hasattr(self, 'editor') and hasattr(self.editor, 'editor'):
-            self.editor.editor.undo()
+        if self._editor_ref is not None:
+            self._editor_ref.undo()
             
     def redoEdit(self):
         """重做编辑操作"""
-        if hasattr(self, 'editor') and hasattr(self.editor, 'editor'):
-            self.editor.editor.redo()
+        if self._editor_ref is not None:
+            self._editor_ref.redo()
             
     def showFindDialog(self):
         """显示查找对话框"""
-        if hasattr(self, 'editor') and hasattr(self.editor, 'showFindDialog'):
-            self.editor.showFindDialog()
+        show = getattr(self.editor, 'showFindDialog', None)
+        if show is not None:
+            show()
             
     def showReplaceDialog(self):
         """显示替换对话框"""
-        if hasattr(self, 'editor') and hasattr(self.editor, 'showReplaceDialog'):
-            self.editor.showReplaceDialog()
+        show = getattr(self.editor, 'showReplaceDialog', None)
+        if show is not None:
+            show()
             
     def toggleExplorer(self):
         """切换文件资源管理器显示状态"""
-        if hasattr(self, 'fileExplorer') and hasattr(self, 'leftSplitter'):
-            visible = self.toggleExplorerAction.isChecked()
-            if not visible:
-                # 保存当前大小
-                self.fileExplorerSize = self.leftSplitter.sizes()[0]
-                # 隐藏
-                sizes = self.leftSplitter.sizes()
-                self.leftSplitter.setSizes([0, sizes[1]])
-            else:
-                # 显示并恢复大小
-                sizes = self.leftSplitter.sizes()
-                if hasattr(self, 'fileExplorerSize'):
-                    self.leftSplitter.setSizes([self.fileExplorerSize, sizes[1]])
-                else:
-                    self.leftSplitter.setSizes([200, sizes[1]])
+        splitter = self.leftSplitter
+        if not self.toggleExplorerAction.isChecked():
+            # 保存当前状态并隐藏
+            self._leftSplitterState = splitter.saveState()
+            sizes = splitter.sizes()
+            splitter.setSizes([0, sizes[1]])
+        elif self._leftSplitterState is None or not splitter.restoreState(self._leftSplitterState):
+            # 没有保存的状态时使用默认大小
+            sizes = splitter.sizes()
+            splitter.setSizes([200, sizes[1]])
                     
     def togglePreview(self):
         """切换Markdown预览显示状态（通过菜单调用）"""
-        if hasattr(self, 'editorPreviewStack'):
-            visible = self.togglePreviewAction.isChecked()
-            if visible:
-                # 切换到预览模式
-                self.isPreviewMode = True
-                self.updatePreview()  # 更新预览内容
-                self.editorPreviewStack.setCurrentIndex(1)  # 显示预览
-                self.previewToggleButton.setChecked(True)
-            else:
-                # 切换到编辑模式
-                self.isPreviewMode = False
-                self.editorPreviewStack.setCurrentIndex(0)  # 显示编辑器
-                self.previewToggleButton.setChecked(False)
+        visible = self.togglePreviewAction.isChecked()
+        if visible:
+            # 切换到预览模式
+            self.isPreviewMode = True
+            self._ensurePreview()
+            self.updatePreview()  # 更新预览内容
+            self.editorPreviewStack.setCurrentIndex(1)  # 显示预览
+            self.previewToggleButton.setChecked(True)
+        else:
+            # 切换到编辑模式
+            self.isPreviewMode = False
+            self.editorPreviewStack.setCurrentIndex(0)  # 显示编辑器
+            self.previewToggleButton.setChecked(False)
                 
     def toggleEditorPreview(self):
         """切换编辑器和预览视图（通过按钮调用）"""
-        if hasattr(self, 'editorPreviewStack'):
-            self.isPreviewMode = self.previewToggleButton.isChecked()
-            if self.isPreviewMode:
-                # 切换到预览模式
-                self.updatePreview()  # 更新预览内容
-                self.editorPreviewStack.setCurrentIndex(1)  # 显示预览
-                self.togglePreviewAction.setChecked(True)
-            else:
-                # 切换到编辑模式
-                self.editorPreviewStack.setCurrentIndex(0)  # 显示编辑器
-                self.togglePreviewAction.setChecked(False)
+        self.isPreviewMode = self.previewToggleButton.isChecked()
+        if self.isPreviewMode:
+            # 切换到预览模式
+            self._ensurePreview()
+            self.updatePreview()  # 更新预览内容
+            self.editorPreviewStack.setCurrentIndex(1)  # 显示预览
+            self.togglePreviewAction.setChecked(True)
+        else:
+            # 切换到编辑模式
+            self.editorPreviewStack.setCurrentIndex(0)  # 显示编辑器
+            self.togglePreviewAction.setChecked(False)
                     
     def toggleGitPanel(self):
         """切换Git面板显示状态"""
-        if hasattr(self, 'gitPanel') and hasattr(self, 'mainSplitter'):
-            visible = self.toggleGitPanelAction.isChecked()
-            if not visible:
-                # 保存当前大小
-                sizes = self.mainSplitter.sizes()
-                self.gitPanelSize = sizes[2]
-                # 隐藏
-                self.mainSplitter.setSizes([sizes[0], sizes[1] + sizes[2], 0])
-            else:
-                # 显示并恢复大小
-                sizes = self.mainSplitter.sizes()
-                if hasattr(self, 'gitPanelSize') and self.gitPanelSize:
-                    self.mainSplitter.setSizes([sizes[0], sizes[1] - self.gitPanelSize, self.gitPanelSize])
-                else:
-                    # 默认分配大小
-                    self.mainSplitter.setSizes([sizes[0], sizes[1] - 250, 250])
+        splitter = self.mainSplitter
+        if not self.toggleGitPanelAction.isChecked():
+            # 保存当前状态并隐藏
+            self._mainSplitterState = splitter.saveState()
+            sizes = splitter.sizes()
+            splitter.setSizes([sizes[0], sizes[1] + sizes[2], 0])
+        elif self._mainSplitterState is None or not splitter.restoreState(self._mainSplitterState):
+            # 没有保存的状态时默认分配大小
+            sizes = splitter.sizes()
+            splitter.setSizes([sizes[0], sizes[1] - 250, 250])
             
     def commitChanges(self):
         """提交变更"""
-        if hasattr(self, 'gitPanel'):
-            self.gitPanel.commitChanges()
+        self.gitPanel.commitChanges()
             
     def pushChanges(self):
         """推送变更"""
-        if hasattr(self, 'gitPanel'):
-            self.gitPanel.pushChanges()
+        self.gitPanel.pushChanges()
             
     def pullChanges(self):
         """拉取变更"""
-        if hasattr(self, 'gitPanel'):
-            self.gitPanel.pullChanges()
+        self.gitPanel.pullChanges()
             
     def manageBranches(self):
         """管理分支"""
-        if hasattr(self, 'gitPanel'):
-            self.gitPanel.manageBranches()
+        self.gitPanel.manageBranches()
             
     def viewHistory(self):
         """查看历史"""
-        if hasattr(self, 'gitPanel'):
-            self.gitPanel.viewHistory()
+        self.gitPanel.viewHistory()
             
     def checkForUpdates(self):
         """检查应用更新"""
-        from PyQt5.QtWidgets import QMessageBox
         QMessageBox.information(
             self, 
             "检查更新", 
@@ -1224,25 +1347,12 @@ class MainWindow(QMainWindow):
                 dev_tools_plugin.open_dev_tools()
             else:
                 # 如果插件未启用，显示提示
-                InfoBar.warning(
-                    title="功能未启用",
-                    content="开发者工具插件未启用，请在插件管理器中启用此插件",
-                    orient=Qt.Horizontal,
-                    position=InfoBarPosition.TOP,
-                    duration=3000,
-                    parent=self
-                )
+                _info_warning(self, "功能未启用", "开发者工具插件未启用，请在插件管理器中启用此插件", 3000,
+                              isClosable=False)
         except Exception as e:
             # 如果发生错误（例如插件不存在），显示错误信息
             warning(f"打开开发者工具时出错: {str(e)}")
-            InfoBar.error(
-                title="功能不可用",
-                content="无法找到开发者工具插件，请确保插件已正确安装",
-                orient=Qt.Horizontal,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=self
-            )
+            _info_error(self, "功能不可用", "无法找到开发者工具插件，请确保插件已正确安装", isClosable=False)
     
     
     def loadFile(self, file_path):
@@ -1251,36 +1361,88 @@ class MainWindow(QMainWindow):
         Args:
             file_path: 文件路径
         """
-        if hasattr(self, 'editor'):
+        if self.editor is not None:
             try:
                 # 检查是否为文本文件
-                import os
-                _, ext = os.path.splitext(file_path)
-                text_exts = ['.txt', '.md', '.markdown', '.py', '.js', '.html', '.css', '.json', '.xml', '.yml', '.yaml']
+                ext = os.path.splitext(file_path)[1].lower()
                 
-                if ext.lower() in text_exts:
-                    # 加载文件内容到编辑器
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                if ext in _TEXT_EXTS:
+                    # 一次stat同时取得大小和修改时间，文件不存在时直接抛出异常
+                    st = os.stat(file_path)
                     
-                    self.editor.setPlainText(content)
-                    self.editor.currentFilePath = file_path
-                    self.statusBar.setCurrentFile(file_path)
+                    # 大文件在后台线程读取
+                    if st.st_size > ASYNC_READ_THRESHOLD:
+                        self._loadFileAsync(file_path)
+                        return
                     
-                    # 如果是Markdown文件，更新预览
-                    if ext.lower() in ['.md', '.markdown']:
-                        self.updatePreview()
+                    # 加载文件内容到编辑器（未修改的文件直接命中缓存）
+                    content = _read_text(file_path, st.st_mtime)
+                    self._fileReadWorker = None
+                    self._applyLoadedFile(file_path, content)
                 else:
-                    from PyQt5.QtWidgets import QMessageBox
                     QMessageBox.warning(self, "不支持的文件类型", f"不支持编辑 {ext} 类型的文件")
             except Exception as e:
-                from PyQt5.QtWidgets import QMessageBox
                 QMessageBox.critical(self, "打开文件失败", f"无法打开文件: {str(e)}")
     
+    def _loadFileAsync(self, file_path):
+        """在后台线程中读取文件，完成后再填充编辑器
+        
+        Args:
+            file_path: 文件路径
+        """
+        self.statusBar.setLoadingFile(file_path)
+        
+        # 之前的读取线程无法中断，让它自然结束，其结果由下面的槽函数忽略
+        worker = FileReadWorker(file_path, self)
+        worker.fileRead.connect(self._onFileRead)
+        worker.readFailed.connect(self._onFileReadFailed)
+        worker.finished.connect(lambda: self._onFileReadWorkerFinished(worker))
+        self._fileReadWorker = worker
+        self._fileReadWorkers.add(worker)
+        worker.start()
+    
+    def _onFileReadWorkerFinished(self, worker):
+        """读取线程结束后释放"""
+        self._fileReadWorkers.discard(worker)
+        worker.deleteLater()
+    
+    def _onFileRead(self, file_path, content):
+        """后台文件读取完成"""
+        # 只处理最近一次请求的结果，忽略已被后续打开操作取代的线程
+        if self.sender() is not self._fileReadWorker:
+            return
+        self._fileReadWorker = None
+        self._applyLoadedFile(file_path, content)
+    
+    def _onFileReadFailed(self, file_path, message):
+        """后台文件读取失败"""
+        if self.sender() is not self._fileReadWorker:
+            return
+        self._fileReadWorker = None
+        self.statusBar.setCurrentFile(self.editor.currentFilePath)
+        QMessageBox.critical(self, "打开文件失败", f"无法打开文件: {message}")
+    
+    def _applyLoadedFile(self, file_path, content):
+        """将已读取的文件内容填充到编辑器
+        
+        Args:
+            file_path: 文件路径
+            content: 文件内容
+        """
+        blocker = QSignalBlocker(self.editor)
+        try:
+            self.editor.setPlainText(content)
+        finally:
+            blocker.unblock()
+        self.editor.currentFilePath = file_path
+        self.configManager.set_last_open_dir(os.path.dirname(file_path))
+        self.statusBar.setCurrentFile(file_path)
+        
+        # 更新预览和导航
+        self._onEditorContentReplaced()
+    
     def cloneRepository(self):
         """克隆远程仓库"""
-        from PyQt5.QtWidgets import QInputDialog, QLineEdit, QFileDialog
-        
         # 获取远程仓库URL
         url, ok = QInputDialog.getText(
             self, "克隆仓库", "请输入远程仓库URL:",
@@ -1295,13 +1457,20 @@ class MainWindow(QMainWindow):
                     # 使用GitPanel的克隆功能
                     self.gitPanel.cloneRepository(url, target_dir)
                 except Exception as e:
-                    from PyQt5.QtWidgets import QMessageBox
                     QMessageBox.critical(self, "克隆失败", f"无法克隆仓库: {str(e)}")
     
     def updateDocumentNavigation(self, document_text):
         """ 更新文档导航 """
         self.documentNavigator.parseDocument(document_text)
         
+    def _scheduleDocumentNavigation(self, document_text=None):
+        """ 重新开始导航更新计时，连续输入时只在停止后解析一次 """
+        self._navigationTimer.start()
+        
+    def _refreshDocumentNavigation(self):
+        """ 按编辑器当前内容更新文档导航 """
+        self.updateDocumentNavigation(self.editor.toPlainText())
+        
     def onCursorPositionChanged(self, line_number):
         """ 处理光标位置变化 """
         # 在这里可以更新状态栏显示当前行列信息
@@ -1366,18 +1535,10 @@ class MainWindow(QMainWindow):
     def requestInlineCompletion(self):
         """请求行内补全"""
         if not self.copilotManager.is_enabled():
-            InfoBar.warning(
-                title="Copilot未启用",
-                content="请先在Copilot设置中配置API密钥",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=self
-            )
+            _info_warning(self, "Copilot未启用", "请先在Copilot设置中配置API密钥", 3000)
             return
             
-        if not hasattr(self, 'editor'):
+        if self.editor is None:
             return
             
         # Import constants from copilot_manager
@@ -1395,28 +1556,12 @@ class MainWindow(QMainWindow):
             self._on_completion_ready
         )
         
-        InfoBar.info(
-            title="生成中",
-            content="正在生成补全建议...",
-            orient=Qt.Horizontal,
-            isClosable=True,
-            position=InfoBarPosition.TOP,
-            duration=2000,
-            parent=self
-        )
+        _info_info(self, "生成中", "正在生成补全建议...")
         
     def showEditMode(self):
         """显示编辑模式"""
         if not self.copilotManager.is_enabled():
-            InfoBar.warning(
-                title="Copilot未启用",
-                content="请先在Copilot设置中配置API密钥",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=self
-            )
+            _info_warning(self, "Copilot未启用", "请先在Copilot设置中配置API密钥", 3000)
             return
             
         # 显示copilot面板并切换到编辑模式
@@ -1428,15 +1573,7 @@ class MainWindow(QMainWindow):
     def showCreationMode(self):
         """显示创作模式"""
         if not self.copilotManager.is_enabled():
-            InfoBar.warning(
-                title="Copilot未启用",
-                content="请先在Copilot设置中配置API密钥",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=self
-            )
+            _info_warning(self, "Copilot未启用", "请先在Copilot设置中配置API密钥", 3000)
             return
             
         # 显示copilot面板并切换到创作模式
@@ -1453,32 +1590,16 @@ class MainWindow(QMainWindow):
             # 重新加载copilot配置
             self.copilotManager.reload_config()
             
-            InfoBar.success(
-                title="设置已保存",
-                content="Copilot配置已更新",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=3000,
-                parent=self
-            )
+            _info_success(self, "设置已保存", "Copilot配置已更新", 3000)
             
     def _on_completion_ready(self, completion: str):
         """处理补全结果"""
-        if hasattr(self, 'editor'):
+        if self.editor is not None:
             # 在光标位置插入补全
             cursor = self.editor.editor.textCursor()
             cursor.insertText(completion)
             
-            InfoBar.success(
-                title="补全完成",
-                content="已插入AI生成的内容",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            _info_success(self, "补全完成", "已插入AI生成的内容")
             
     def _on_edit_ready(self, edited_text: str):
         """处理编辑结果"""
@@ -1499,7 +1620,7 @@ class MainWindow(QMainWindow):
             QMessageBox.Yes
         )
         
-        if reply == QMessageBox.Yes and hasattr(self, 'editor'):
+        if reply == QMessageBox.Yes and self.editor is not None:
             self.editor.editor.setPlainText(content)
             
     def _on_chat_requested(self, message: str):
@@ -1541,14 +1662,6 @@ class MainWindow(QMainWindow):
         """处理Copilot错误"""
         # Show user-friendly message without exposing sensitive details
         user_message = "Copilot 出现错误，请稍后重试或检查网络连接。"
-        InfoBar.error(
-            title="Copilot错误",
-            content=user_message,
-            orient=Qt.Horizontal,
-            isClosable=True,
-            position=InfoBarPosition.TOP,
-            duration=5000,
-            parent=self
-        )
+        _info_error(self, "Copilot错误", user_message, 5000)
         # Log detailed error for debugging
         error(f"Copilot error details: {error_msg}", category=LogCategory.ERROR)
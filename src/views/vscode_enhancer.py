@@ -7,7 +7,7 @@
 """
 
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout
-from PyQt5.QtCore import QPropertyAnimation, QEasingCurve
+from PyQt5.QtCore import QPropertyAnimation, QEasingCurve, QTimer
 
 from src.components.vscode_activity_bar import VSCodeActivityBar
 from src.components.vscode_status_bar import VSCodeStatusBar
@@ -95,17 +95,13 @@ class VSCodeMainWindowEnhancer:
         # 将文件浏览器和文档导航器放入侧边栏
         if hasattr(main_window, 'leftSplitter'):
             sidebar_layout = self.sidebar_container.layout()
-            # 移除leftSplitter的父组件
-            left_splitter = main_window.leftSplitter
-            left_splitter.setParent(None)
-            sidebar_layout.addWidget(left_splitter)
+            # addWidget会直接完成重新设置父组件，无需先setParent(None)
+            sidebar_layout.addWidget(main_window.leftSplitter)
         
         # 将编辑器和预览放入编辑器区域
         if hasattr(main_window, 'editorSplitter'):
             editor_layout = self.editor_container.layout()
-            editor_splitter = main_window.editorSplitter
-            editor_splitter.setParent(None)
-            editor_layout.addWidget(editor_splitter)
+            editor_layout.addWidget(main_window.editorSplitter)
         
         # 替换原有的中心部件
         main_window.centralWidget().setParent(None)
@@ -136,6 +132,9 @@ class VSCodeMainWindowEnhancer:
         self.sidebar_animation = QPropertyAnimation(self.sidebar_container, b"maximumWidth")
         self.sidebar_animation.setDuration(200)
         self.sidebar_animation.setEasingCurve(QEasingCurve.InOutQuad)
+        # 只连接一次，收起方向由 _sidebarCollapsing 标志决定
+        self._sidebarCollapsing = False
+        self.sidebar_animation.finished.connect(self._onSidebarAnimFinished)
         
         # 面板展开/收起动画（如果需要的话）
         # self.panel_animation = QPropertyAnimation(...)
@@ -156,9 +155,18 @@ class VSCodeMainWindowEnhancer:
         self.vscode_statusbar.lineColumnClicked.connect(self._onLineColumnClicked)
         
         # 编辑器光标位置变化
-        if hasattr(self.main_window, 'editor') and hasattr(self.main_window.editor, 'editor'):
-            editor = self.main_window.editor.editor
-            editor.cursorPositionChanged.connect(self._updateCursorPosition)
+        # 缓存编辑器控件，光标每次移动时无需重新查找
+        self._editor = getattr(getattr(self.main_window, 'editor', None), 'editor', None)
+        if self._editor is not None:
+            # 连续移动光标（如按住方向键）时合并更新，50毫秒内只刷新一次行列号
+            self._cursorTimer = QTimer(self.main_window)
+            self._cursorTimer.setSingleShot(True)
+            self._cursorTimer.setInterval(50)
+            self._cursorTimer.timeout.connect(self._updateCursorPosition)
+            self._cursorSignalConnected = False
+            self._setCursorTracking(self.vscode_statusbar.isVisible())
+            # 状态栏隐藏时不再跟踪光标位置
+            self.vscode_statusbar.visibilityChanged.connect(self._setCursorTracking)
         
     def _onExplorerClicked(self):
         """处理资源管理器按钮点击"""
@@ -219,14 +227,31 @@ class VSCodeMainWindowEnhancer:
         # 可以打开跳转到行对话框
         pass
         
+    def _setCursorTracking(self, enabled):
+        """连接或断开光标位置跟踪
+        
+        Args:
+            enabled: True时连接光标信号并立即刷新一次行列号，False时断开
+        """
+        if enabled == self._cursorSignalConnected:
+            return
+        self._cursorSignalConnected = enabled
+        if enabled:
+            self._editor.cursorPositionChanged.connect(self._onCursorPositionChanged)
+            self._updateCursorPosition()
+        else:
+            self._editor.cursorPositionChanged.disconnect(self._onCursorPositionChanged)
+            self._cursorTimer.stop()
+        
+    def _onCursorPositionChanged(self):
+        """光标移动时启动刷新定时器，定时器已在计时时不重新计时，保证连续移动时也会定期刷新"""
+        if not self._cursorTimer.isActive():
+            self._cursorTimer.start()
+        
     def _updateCursorPosition(self):
         """更新光标位置显示"""
-        if hasattr(self.main_window, 'editor') and hasattr(self.main_window.editor, 'editor'):
-            editor = self.main_window.editor.editor
-            cursor = editor.textCursor()
-            line = cursor.blockNumber() + 1
-            column = cursor.columnNumber() + 1
-            self.vscode_statusbar.setLineColumn(line, column)
+        cursor = self._editor.textCursor()
+        self.vscode_statusbar.setLineColumn(cursor.blockNumber() + 1, cursor.columnNumber() + 1)
         
     def toggleSidebar(self):
         """切换侧边栏显示/隐藏"""
@@ -234,15 +259,10 @@ class VSCodeMainWindowEnhancer:
             # 隐藏侧边栏
             self.sidebar_animation.setStartValue(self.sidebar_container.width())
             self.sidebar_animation.setEndValue(0)
-            # 避免重复连接导致的内存泄漏和多次回调
-            try:
-                self.sidebar_animation.finished.disconnect()
-            except TypeError:
-                # 如果没有已连接的槽，disconnect 会抛出 TypeError，忽略即可
-                pass
-            self.sidebar_animation.finished.connect(lambda: self.sidebar_container.hide())
+            self._sidebarCollapsing = True
         else:
             # 显示侧边栏
+            self._sidebarCollapsing = False
             self.sidebar_container.show()
             self.sidebar_animation.setStartValue(0)
             self.sidebar_animation.setEndValue(250)
@@ -250,6 +270,11 @@ class VSCodeMainWindowEnhancer:
         self.sidebar_animation.start()
         self.sidebar_visible = not self.sidebar_visible
         
+    def _onSidebarAnimFinished(self):
+        """侧边栏动画结束，收起时隐藏容器"""
+        if self._sidebarCollapsing:
+            self.sidebar_container.hide()
+        
     def applyTheme(self, dark_mode):
         """应用主题
         
@@ -15,12 +15,19 @@ import tempfile
 import time
 import shutil
 import re
+import ast
 import hashlib
 from pathlib import Path
 import json
 import socket
 import uuid
 import datetime
+from functools import lru_cache
+from collections import deque
+
+# 当前操作系统，只在启动时查询一次
+SYSTEM = platform.system()
+IS_WINDOWS = SYSTEM == "Windows"
 
 # 检测是否在PyInstaller环境中运行
 is_pyinstaller = getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
@@ -34,11 +41,47 @@ except ImportError:
 # 调试模式，True为显示控制台，False为隐藏控制台
 DEBUG = False  # 可根据需要修改
 
-# 国内镜像源
-PIP_MIRROR = "-i http://mirrors.aliyun.com/pypi/simple --trusted-host mirrors.aliyun.com"
+# 虚拟环境中pip低于此版本时才升级
+PIP_MIN_VERSION = (24, 0)
+
+# requirements.txt中每行开头的包名
+REQ_NAME_RE = re.compile(r"([a-zA-Z0-9_\-\.]+)")
+
+# 包名中可互换的分隔符（PEP 503）
+CANON_NAME_RE = re.compile(r"[-_.]+")
+
+# Python安装程序的下载源，只使用python.org官方源；安装程序会被静默以管理员权限运行，不使用第三方镜像
+PYTHON_DOWNLOAD_BASES = (
+    "https://www.python.org/ftp/python",
+)
+
+# Python安装程序的SHA-256校验值，按安装程序文件名索引
+# 值应由python.org官方文件计算得到（sha256sum），更换安装程序版本时必须同步更新；
+# 尚未填入（None）时只打印实际校验值并继续安装，填入后不一致的安装程序会被删除且不会运行
+EXPECTED_SHA256 = {
+    "python-3.10.11-amd64.exe": None,
+    "python-3.10.11.exe": None,
+}
+
+# 并行下载的连接数和分段大小
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
 
 # 辅助文件路径
-DEV_INFO_FILE = os.path.join(os.path.expanduser("~"), ".mgit", "dev_info.json")
+USER_HOME = os.path.expanduser("~")
+APP_DATA_DIR = os.path.join(USER_HOME, ".mgit")
+DEV_INFO_FILE = os.path.join(APP_DATA_DIR, "dev_info.json")
+DEV_RUNTIME_FILE = os.path.join(APP_DATA_DIR, "dev_runtime.json")
+NETWORK_ENV_FILE = os.path.join(APP_DATA_DIR, "network_env.json")
+
+# 虚拟环境中记录requirements.txt哈希值的文件（BLAKE2b，与旧的MD5记录区分）
+REQUIREMENTS_HASH_FILE = os.path.join("venv-dev", ".requirements_blake2b")
+
+# 虚拟环境中记录插件目录指纹的文件，插件未变化时跳过依赖扫描
+PLUGINS_FINGERPRINT_FILE = os.path.join("venv-dev", ".plugins_fp")
+
+# 网络环境检测结果的缓存有效期（秒）
+NETWORK_ENV_TTL = 7 * 24 * 3600
 
 def print_info(message):
     """打印信息消息"""
@@ -52,80 +95,194 @@ def print_error(message):
     """打印错误消息"""
     print(f"[错误] {message}")
 
+@lru_cache(maxsize=None)
 def get_system_python():
-    """获取系统Python路径"""
-    system = platform.system()
-    python_cmd = "python" if system == "Windows" else "python3"
+    """获取系统Python路径
     
-    try:
-        # 检查系统Python是否可用
-        subprocess.check_output([python_cmd, "--version"], stderr=subprocess.STDOUT)
-        return python_cmd
-    except (subprocess.SubprocessError, FileNotFoundError):
-        # 尝试其他可能的命令
-        alternatives = ["python3", "python"] if system == "Windows" else ["python", "python3.10", "python3.11"]
-        
-        for cmd in alternatives:
-            try:
-                subprocess.check_output([cmd, "--version"], stderr=subprocess.STDOUT)
-                return cmd
-            except (subprocess.SubprocessError, FileNotFoundError):
-                continue
-        
-        return None
+    只在PATH中查找可执行文件，不启动子进程；版本由check_python检查
+    """
+    if IS_WINDOWS:
+        candidates = ("python", "python3")
+    else:
+        candidates = ("python3", "python", "python3.11", "python3.10")
+    
+    for cmd in candidates:
+        path = shutil.which(cmd)
+        if path:
+            return path
+    
+    return None
 
-def check_python():
-    """检查Python是否已安装，并且版本是否大于3.10"""
-    # 如果是在PyInstaller环境中，使用系统Python而不是打包环境的Python
-    python_cmd = get_system_python() if is_pyinstaller else "python"
+def check_python(quiet=False):
+    """检查Python是否已安装，并且版本是否大于3.10
+    
+    Args:
+        quiet: 为True时不输出任何信息，用于安装后的轮询
+    """
+    show_info = (lambda message: None) if quiet else print_info
+    show_warning = (lambda message: None) if quiet else print_warning
+    
+    # 非打包环境下虚拟环境由当前解释器创建，直接检查自身版本，无需启动子进程
+    if not is_pyinstaller:
+        major, minor, micro = sys.version_info[:3]
+        show_info(f"检测到Python: Python {major}.{minor}.{micro}")
+        if (major, minor) >= (3, 10):
+            show_info(f"Python版本满足要求: {major}.{minor}")
+            return True
+        show_warning(f"Python版本过低: {major}.{minor}，需要3.10或更高版本")
+        return False
+    
+    # PyInstaller环境中，检查系统Python而不是打包环境的Python
+    python_cmd = get_system_python()
     
     if not python_cmd:
-        print_warning("未检测到系统Python，需要安装Python 3.10或更高版本")
+        # 只缓存通过检查的结果，安装Python后重新检查时需要再次查找
+        get_system_python.cache_clear()
+        show_warning("未检测到系统Python，需要安装Python 3.10或更高版本")
         return False
     
     try:
-        # 尝试获取Python版本
-        version_info = subprocess.check_output(
-            [python_cmd, "--version"], 
-            stderr=subprocess.STDOUT,
-            universal_newlines=True
+        # 一次调用获取完整版本号，如 3.10.11
+        # 设置超时，避免异常的解释器挂起启动器
+        result = subprocess.run(
+            [python_cmd, "-c", "import sys; v = sys.version_info; print(f'{v.major}.{v.minor}.{v.micro}')"], 
+            capture_output=True, text=True, timeout=3, check=True
         )
-        print_info(f"检测到Python: {version_info.strip()}")
+        full_version = result.stdout.strip()
+        show_info(f"检测到Python: Python {full_version}")
         
-        # 使用sys.version_info获取更详细的版本信息
-        result = subprocess.check_output(
-            [python_cmd, "-c", "import sys; print(f'{sys.version_info.major}.{sys.version_info.minor}')"], 
-            universal_newlines=True
-        )
+        major, minor = map(int, full_version.split('.')[:2])
+        version = f"{major}.{minor}"
         
-        version = result.strip()
-        major, minor = map(int, version.split('.'))
-        
-        if major >= 3 and minor >= 10:
-            print_info(f"Python版本满足要求: {version}")
+        if (major, minor) >= (3, 10):
+            show_info(f"Python版本满足要求: {version}")
             return True
         else:
-            print_warning(f"Python版本过低: {version}，需要3.10或更高版本")
+            # 版本过低的解释器不缓存，避免安装新版本后仍检查同一个路径
+            get_system_python.cache_clear()
+            show_warning(f"Python版本过低: {version}，需要3.10或更高版本")
             return False
     except (subprocess.SubprocessError, FileNotFoundError):
-        print_warning("未检测到Python，需要安装Python 3.10或更高版本")
+        # 如WindowsApps中的python.exe占位程序，同样不缓存
+        get_system_python.cache_clear()
+        show_warning("未检测到Python，需要安装Python 3.10或更高版本")
         return False
 
+def read_registry_path():
+    """从注册表读取系统和用户的PATH并拼接（仅Windows）
+    
+    直接读取注册表，无需启动PowerShell
+    """
+    import winreg
+    
+    def query(root, key_path):
+        try:
+            with winreg.OpenKey(root, key_path) as key:
+                value, value_type = winreg.QueryValueEx(key, "Path")
+        except OSError:
+            return ""
+        if value_type == winreg.REG_EXPAND_SZ:
+            value = winreg.ExpandEnvironmentStrings(value)
+        return value
+    
+    machine = query(winreg.HKEY_LOCAL_MACHINE,
+                    r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment")
+    user = query(winreg.HKEY_CURRENT_USER, "Environment")
+    return f"{machine};{user}"
+
+def fetch_range(url, path, start, end, retries=3):
+    """下载文件的[start, end]字节区间并写入path的对应位置，失败时按指数退避重试"""
+    delay = 1.0
+    for attempt in range(retries):
+        try:
+            request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+            # 每个线程使用独立的文件句柄，Windows上没有os.pwrite
+            with urllib.request.urlopen(request, timeout=30) as response, open(path, 'r+b') as f:
+                if response.status != 206:
+                    raise IOError(f"服务器未返回分段内容: HTTP {response.status}")
+                f.seek(start)
+                written = 0
+                for chunk in iter(lambda: response.read(1 << 20), b""):
+                    f.write(chunk)
+                    written += len(chunk)
+            if written != end - start + 1:
+                raise IOError(f"分段不完整: {written}/{end - start + 1} 字节")
+            return
+        except Exception:
+            if attempt == retries - 1:
+                raise
+            time.sleep(delay)
+            delay *= 2
+
+def download_file(urls, path, workers=DOWNLOAD_WORKERS, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    """依次尝试各个URL下载文件到path，成功返回True
+    
+    服务器支持Range时按chunk_size分段、用workers个连接并行下载，否则退回单连接流式下载
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    for url in urls:
+        try:
+            request = urllib.request.Request(url, method="HEAD")
+            with urllib.request.urlopen(request, timeout=10) as response:
+                length = int(response.headers.get('Content-Length') or 0)
+                accepts_ranges = response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+        except Exception as e:
+            # 部分服务器或代理不支持HEAD，退回单连接流式下载而不是放弃该URL
+            print_warning(f"获取 {url} 的文件信息失败: {str(e)}，改用普通下载")
+            length = 0
+            accepts_ranges = False
+        
+        try:
+            if length:
+                print_info(f"安装程序大小: {length / (1024 * 1024):.1f} MB ({url})")
+            
+            if accepts_ranges and length > chunk_size:
+                # 预分配文件，各分段直接写入各自的偏移位置
+                with open(path, 'wb') as f:
+                    f.truncate(length)
+                ranges = [(start, min(start + chunk_size, length) - 1)
+                          for start in range(0, length, chunk_size)]
+                with ThreadPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+                    futures = [executor.submit(fetch_range, url, path, start, end) for start, end in ranges]
+                    for future in futures:
+                        future.result()
+                return True
+            
+            # 单连接流式下载，按1MB分块直接写入磁盘
+            received = 0
+            with urllib.request.urlopen(url, timeout=30) as response, open(path, 'wb') as f:
+                length = length or int(response.headers.get('Content-Length') or 0)
+                for chunk in iter(lambda: response.read(1 << 20), b""):
+                    f.write(chunk)
+                    received += len(chunk)
+            # 下载不完整时不使用该文件，避免出现难以理解的安装失败
+            if length and received != length:
+                raise IOError(f"下载不完整: {received}/{length} 字节")
+            return True
+        except Exception as e:
+            print_warning(f"从 {url} 下载失败: {str(e)}")
+    
+    return False
+
 def download_python():
     """下载并安装Python"""
-    system = platform.system()
+    # 非打包环境下检查的是运行本脚本的解释器，另装一个Python不会改变检查结果
+    if not is_pyinstaller:
+        print_error(f"当前解释器版本过低: {sys.executable}")
+        print_info("请安装Python 3.10或更高版本后，使用新的解释器重新运行 start.py")
+        print_info("下载地址: https://www.python.org/downloads/")
+        return False
     
-    if system == "Windows":
+    if IS_WINDOWS:
         print_info("正在准备下载Python安装程序...")
         
         # 检测系统架构
         is_64bit = platform.machine().endswith('64')
         
         # 构建下载URL
-        if is_64bit:
-            download_url = "https://www.python.org/ftp/python/3.10.11/python-3.10.11-amd64.exe"
-        else:
-            download_url = "https://www.python.org/ftp/python/3.10.11/python-3.10.11.exe"
+        installer_name = "python-3.10.11-amd64.exe" if is_64bit else "python-3.10.11.exe"
+        download_urls = [f"{base}/3.10.11/{installer_name}" for base in PYTHON_DOWNLOAD_BASES]
         
         # 创建临时文件
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.exe')
@@ -134,9 +291,28 @@ def download_python():
         
         print_info(f"正在下载Python 3.10.11 安装程序...")
         try:
-            # 下载安装程序
-            urllib.request.urlretrieve(download_url, installer_path)
-            print_info("下载完成，正在安装Python...")
+            # 下载安装程序，支持断点范围请求时多连接并行下载
+            if not download_file(download_urls, installer_path):
+                print_error("Python安装程序下载失败")
+                os.unlink(installer_path)
+                return False
+            
+            # 校验SHA-256，与预置值不一致时删除安装程序并放弃安装
+            with open(installer_path, 'rb') as f:
+                digest = hashlib.file_digest(f, "sha256") if hasattr(hashlib, 'file_digest') \
+                    else hashlib.sha256(f.read())
+            actual_sha256 = digest.hexdigest()
+            expected_sha256 = EXPECTED_SHA256.get(installer_name)
+            if expected_sha256 is None:
+                print_warning(f"尚未预置 {installer_name} 的校验值，无法验证安装程序 (SHA-256: {actual_sha256})")
+                print_info("下载完成，正在安装Python...")
+            elif actual_sha256 != expected_sha256:
+                os.unlink(installer_path)
+                print_error(f"安装程序校验失败，已删除: 期望 {expected_sha256}，实际 {actual_sha256}")
+                print_info("请手动安装Python 3.10或更高版本: https://www.python.org/downloads/")
+                return False
+            else:
+                print_info("下载完成，SHA-256校验通过，正在安装Python...")
             
             # 构建安装命令 - 使用/quiet选项静默安装，并添加Python到PATH
             install_args = [
@@ -165,14 +341,20 @@ def download_python():
                 
             # 刷新环境变量
             print_info("正在刷新环境变量...")
-            os.environ["PATH"] = subprocess.check_output(
-                'powershell -command "[System.Environment]::GetEnvironmentVariable(\'PATH\',\'Machine\') + \';\' + [System.Environment]::GetEnvironmentVariable(\'PATH\',\'User\')"',
-                shell=True
-            ).decode('utf-8').strip()
+            os.environ["PATH"] = read_registry_path()
+            # PATH已变化，之前找到的解释器路径不再可信
+            get_system_python.cache_clear()
             
-            # 验证安装
+            # 验证安装，按指数退避轮询，安装已生效时立即返回
             print_info("等待Python安装生效...")
-            time.sleep(5)  # 等待安装完成和环境变量生效
+            deadline = time.time() + 30
+            delay = 0.2
+            # 轮询时静默检查，避免每次未检测到都打印警告；最后再检查一次并输出结果
+            while time.time() < deadline:
+                if check_python(quiet=True):
+                    break
+                time.sleep(delay)
+                delay = min(delay * 1.5, 2.0)
             
             return check_python()
             
@@ -188,108 +370,187 @@ def download_python():
         input("安装完成后，请按Enter键继续...")
         return check_python()
 
+def load_requirements(path=Path("requirements.txt")):
+    """一次读取requirements.txt，返回 (原始字节, BLAKE2b哈希, 包名列表)，文件不存在时返回None"""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    
+    packages = []
+    for line in data.decode('utf-8').splitlines():
+        line = line.strip()
+        # 跳过注释和空行
+        if not line or line.startswith('#'):
+            continue
+        
+        # 提取包名
+        match = REQ_NAME_RE.match(line)
+        if match:
+            packages.append(match.group(1))
+    
+    return data, hashlib.blake2b(data).hexdigest(), packages
+
+def canonicalize_name(name):
+    """按PEP 503规范化包名，如 Requests_Toolbelt -> requests-toolbelt"""
+    return CANON_NAME_RE.sub("-", name).lower()
+
+def requirement_name(requirement):
+    """提取依赖声明中的规范化包名，如 'Pillow>=8.2.0' -> 'pillow'"""
+    requirement = requirement.strip()
+    match = REQ_NAME_RE.match(requirement)
+    return canonicalize_name(match.group(1) if match else requirement)
+
 def get_requirements_hash():
     """获取requirements.txt的哈希值，用于检测文件是否变化"""
     try:
-        requirements_path = Path("requirements.txt")
-        if not requirements_path.exists():
-            return None
-            
-        # 读取文件内容
-        with open(requirements_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # 计算MD5哈希值
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        requirements = load_requirements()
+        return requirements[1] if requirements else None
     except Exception as e:
         print_warning(f"计算requirements.txt哈希值失败: {str(e)}")
         return None
 
+def configure_pip_environment():
+    """设置pip相关环境变量，对之后启动的所有pip子进程生效"""
+    # 禁用用户安装模式
+    os.environ['PIP_USER'] = '0'
+    # 跳过pip每次启动时向PyPI查询自身新版本的网络请求，以及Python版本提示
+    os.environ['PIP_DISABLE_PIP_VERSION_CHECK'] = '1'
+    os.environ['PIP_NO_PYTHON_VERSION_WARNING'] = '1'
+
+def get_pip_version(python_path):
+    """读取虚拟环境中pip的版本号元组，读取失败时返回(0,)
+    
+    通过importlib.metadata读取元数据，不需要导入pip本身
+    """
+    try:
+        result = subprocess.run(
+            [python_path, "-c", "import importlib.metadata as m; print(m.version('pip'))"],
+            capture_output=True, text=True, timeout=10, check=True
+        )
+        return tuple(int(part) for part in result.stdout.strip().split('.')[:2])
+    except (subprocess.SubprocessError, OSError, ValueError):
+        return (0,)
+
+def compile_site_packages(python_path):
+    """用全部CPU核心并行预编译虚拟环境中的字节码
+    
+    pip安装时使用--no-compile跳过逐个文件的串行编译，安装完成后在这里统一编译
+    """
+    if IS_WINDOWS:
+        site_dirs = [os.path.join("venv-dev", "Lib", "site-packages")]
+    else:
+        site_dirs = [str(path) for path in Path("venv-dev").glob("lib/python*/site-packages")]
+    # 不传目录时compileall会编译整个sys.path
+    if not site_dirs:
+        return
+    print_info("正在预编译依赖库字节码...")
+    # 部分包带有无法编译的示例或测试文件，编译失败不影响使用，忽略返回值
+    subprocess.run([python_path, "-m", "compileall", "-j", "0", "-q", *site_dirs],
+                   capture_output=True, text=True)
+
+def find_uv():
+    """查找uv可执行文件，未安装时返回None，此时回退到pip"""
+    return shutil.which("uv")
+
+def run_streaming(cmd, tail_lines=200):
+    """运行耗时的安装命令并实时输出日志
+    
+    不把全部输出缓存在内存中，只保留最后tail_lines行，供失败时报告错误
+    """
+    tail = deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, errors='replace', bufsize=1) as proc:
+        for line in proc.stdout:
+            print(line, end="")
+            tail.append(line)
+    output = "".join(tail)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout=output, stderr=output)
+
+def uv_pip_install(uv_path, python_path, args, index_url=None):
+    """使用uv为指定解释器安装依赖，成功返回True，失败时由调用方回退到pip"""
+    cmd = [uv_path, "pip", "install", "--python", python_path, *args]
+    if index_url:
+        cmd += ["--index-url", index_url]
+    result = run_streaming(cmd)
+    if result.returncode != 0:
+        print_warning(f"uv安装失败，回退到pip: {result.stderr.strip()}")
+        return False
+    return True
+
+# 在虚拟环境解释器中执行，直接读取已安装发行包的元数据，不必加载pip
+INSTALLED_PACKAGES_SCRIPT = (
+    "import json, importlib.metadata as m; "
+    "print(json.dumps({d.metadata['Name'].lower(): d.version "
+    "for d in m.distributions() if d.metadata['Name']}))"
+)
+
 def get_installed_packages(python_path):
-    """获取已安装的包列表"""
+    """获取已安装的包列表，返回{小写包名: 版本}"""
     try:
-        result = subprocess.check_output(
-            [python_path, "-m", "pip", "freeze"], 
-            universal_newlines=True
+        result = subprocess.run(
+            [python_path, "-c", INSTALLED_PACKAGES_SCRIPT],
+            capture_output=True, text=True, check=True
         )
-        
-        # 解析pip freeze的输出
-        packages = {}
-        for line in result.strip().split('\n'):
-            if line and not line.startswith('#'):
-                # 处理不同格式的包名和版本
-                if '==' in line:
-                    name, version = line.split('==', 1)
-                    packages[name.lower()] = version
-                elif '>=' in line:
-                    name = line.split('>=', 1)[0]
-                    packages[name.lower()] = None
-                elif '@' in line:  # git安装格式
-                    name = line.split('@', 1)[0]
-                    if ' ' in name:
-                        name = name.split(' ')[0]
-                    packages[name.lower()] = None
-                else:
-                    packages[line.lower()] = None
-                    
-        return packages
+        return json.loads(result.stdout)
     except Exception as e:
         print_warning(f"获取已安装包列表失败: {str(e)}")
         return {}
 
-def parse_requirements():
-    """解析requirements.txt文件"""
-    requirements_path = Path("requirements.txt")
-    if not requirements_path.exists():
-        return []
-        
+def read_requirements_record():
+    """读取上次安装时记录的 (requirements.txt哈希值, mtime_ns)，不存在的项为None"""
     try:
-        with open(requirements_path, 'r', encoding='utf-8') as f:
-            content = f.readlines()
-            
-        packages = []
-        for line in content:
-            line = line.strip()
-            # 跳过注释和空行
-            if not line or line.startswith('#'):
-                continue
-                
-            # 提取包名
-            match = re.match(r'([a-zA-Z0-9_\-\.]+).*', line)
-            if match:
-                packages.append(match.group(1))
-                
-        return packages
-    except Exception as e:
-        print_warning(f"解析requirements.txt失败: {str(e)}")
-        return []
+        fields = Path(REQUIREMENTS_HASH_FILE).read_text().split()
+    except OSError:
+        return None, None
+    last_hash = fields[0] if fields else None
+    last_mtime = int(fields[1]) if len(fields) > 1 and fields[1].isdigit() else None
+    return last_hash, last_mtime
+
+def save_requirements_record(current_hash, mtime_ns):
+    """记录本次安装对应的requirements.txt哈希值和mtime_ns"""
+    content = current_hash if mtime_ns is None else f"{current_hash}\n{mtime_ns}"
+    Path(REQUIREMENTS_HASH_FILE).write_text(content + "\n")
+
+def requirements_mtime_ns():
+    """返回requirements.txt的mtime_ns，文件不存在时返回None"""
+    try:
+        return os.stat("requirements.txt").st_mtime_ns
+    except OSError:
+        return None
 
 def check_and_update_packages():
     """检查并更新新增的依赖包"""
-    venv_hash_file = Path("venv-dev/.requirements_hash")
-    current_hash = get_requirements_hash()
+    # 先只比较修改时间：requirements.txt自上次安装后未被修改时，连哈希都不用计算
+    mtime_ns = requirements_mtime_ns()
+    last_hash, last_mtime = read_requirements_record()
+    if mtime_ns is not None and mtime_ns == last_mtime:
+        print_info("依赖库无变化，无需更新")
+        return True
+    
+    try:
+        requirements = load_requirements()
+    except Exception as e:
+        print_warning(f"读取requirements.txt失败: {str(e)}")
+        requirements = None
     
     # 如果requirements.txt不存在
-    if current_hash is None:
+    if requirements is None:
         print_warning("requirements.txt文件不存在，跳过依赖检查")
         return True
-        
-    # 获取上次安装时的哈希值
-    last_hash = None
-    if venv_hash_file.exists():
-        try:
-            with open(venv_hash_file, 'r') as f:
-                last_hash = f.read().strip()
-        except:
-            pass
+    _, current_hash, required_packages = requirements
             
-    # 如果哈希值相同，说明requirements.txt没有变化
+    # 如果哈希值相同，说明requirements.txt没有变化，只是修改时间变了
     if current_hash == last_hash:
+        try:
+            save_requirements_record(current_hash, mtime_ns)
+        except OSError:
+            pass
         print_info("依赖库无变化，无需更新")
         return True
         
     # 获取Python和pip路径
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         python_path = os.path.join("venv-dev", "Scripts", "python")
         pip_path = os.path.join("venv-dev", "Scripts", "pip")
     else:
@@ -298,40 +559,49 @@ def check_and_update_packages():
     
     # 检测是否使用国内镜像
     use_china_mirror = is_in_china()
-    mirror_opt = ""
+    mirror_args = []
+    mirror_url = None
     if use_china_mirror:
         mirrors = get_pip_mirrors()
         if mirrors:
             mirror_url = mirrors[0]["url"]
             mirror_host = mirror_url.split("/")[2]
-            mirror_opt = f" -i {mirror_url} --trusted-host {mirror_host}"
+            mirror_args = ["-i", mirror_url, "--trusted-host", mirror_host]
             print_info(f"使用{mirrors[0]['name']}镜像源安装依赖")
             
-    # 设置环境变量，禁用用户安装模式
-    os.environ['PIP_USER'] = '0'
+    configure_pip_environment()
+    
+    uv_path = find_uv()
         
     try:
         # 获取已安装的包
         installed_packages = get_installed_packages(python_path)
         
-        # 获取requirements.txt中的包
-        required_packages = parse_requirements()
-        
-        # 找出新增的包
-        new_packages = []
-        for package in required_packages:
-            if package.lower() not in installed_packages:
-                new_packages.append(package)
+        # 找出新增的包，按规范化名称比较，避免大小写和-_.差异导致重复安装
+        installed_names = {canonicalize_name(name) for name in installed_packages}
+        new_packages = [package for package in required_packages
+                        if canonicalize_name(package) not in installed_names]
                 
         # 如果有新增的包，安装它们
         if new_packages:
             print_info(f"检测到{len(new_packages)}个新增依赖库，正在安装...")
+            # uv一次性并行安装全部新增包，成功则无需逐个调用pip
+            if uv_path and uv_pip_install(uv_path, python_path, new_packages, mirror_url):
+                new_packages = []
+            else:
+                # 所有新增包交给一次pip调用，只启动一次pip并统一解析依赖
+                # 使用--no-user选项避免在虚拟环境中出现用户安装问题
+                result = run_streaming([pip_path, "install", "--no-user", "--no-compile", *new_packages, *mirror_args])
+                if result.returncode == 0:
+                    new_packages = []
+                else:
+                    print_error(f"批量安装失败: {result.stderr}")
+                    print_info("逐个安装以定位失败的依赖库...")
             for package in new_packages:
                 print_info(f"正在安装: {package}")
-                # 使用--no-user选项避免在虚拟环境中出现用户安装问题
-                cmd = f"{pip_path} install {package} --no-user {mirror_opt}"
+                cmd = [pip_path, "install", package, "--no-user", "--no-compile", *mirror_args]
                 try:
-                    subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+                    subprocess.run(cmd, check=True, capture_output=True, text=True)
                     print_info(f"成功安装: {package}")
                 except subprocess.CalledProcessError as e:
                     print_error(f"安装失败: {package}")
@@ -340,35 +610,39 @@ def check_and_update_packages():
                     # 尝试其他安装方式
                     print_info(f"尝试使用隔离模式安装: {package}")
                     try:
-                        cmd = f"{pip_path} install {package} --no-user --isolated {mirror_opt}"
-                        subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+                        cmd = [pip_path, "install", package, "--no-user", "--no-compile", "--isolated", *mirror_args]
+                        subprocess.run(cmd, check=True, capture_output=True, text=True)
                         print_info(f"成功安装: {package}")
                     except subprocess.CalledProcessError as e2:
                         print_error(f"隔离模式安装也失败: {package}")
                         print_error(f"错误信息: {e2.stderr}")
                 
+            compile_site_packages(python_path)
             print_info("新增依赖库安装完成")
         else:
             # 如果没有新增包但哈希值不同，可能是版本要求变了，重新安装所有依赖
             print_info("依赖库有更新，正在重新安装...")
-            cmd = f"{pip_path} install -r requirements.txt --no-user {mirror_opt}"
+            cmd = [pip_path, "install", "-r", "requirements.txt", "--no-user", "--no-compile", *mirror_args]
             try:
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-                if result.returncode != 0:
+                if uv_path and uv_pip_install(uv_path, python_path, ["-r", "requirements.txt"], mirror_url):
+                    result = None
+                else:
+                    result = run_streaming(cmd)
+                if result is not None and result.returncode != 0:
                     print_error(f"安装依赖失败: {result.stderr}")
                     # 尝试使用隔离模式
                     print_info("尝试使用隔离模式安装依赖...")
-                    cmd = f"{pip_path} install -r requirements.txt --no-user --isolated {mirror_opt}"
-                    subprocess.run(cmd, shell=True, check=True)
+                    cmd = [pip_path, "install", "-r", "requirements.txt", "--no-user", "--no-compile", "--isolated", *mirror_args]
+                    subprocess.run(cmd, check=True)
             except Exception as e:
                 print_error(f"安装依赖时出错: {str(e)}")
                 return False
                 
+            compile_site_packages(python_path)
             print_info("依赖库更新完成")
             
         # 保存新的哈希值
-        with open(venv_hash_file, 'w') as f:
-            f.write(current_hash)
+        save_requirements_record(current_hash, mtime_ns)
             
         return True
     except Exception as e:
@@ -397,58 +671,101 @@ def create_venv():
             
         print_info(f"使用 {python_executable} 创建虚拟环境")
         
-        # 创建虚拟环境
-        subprocess.run([python_executable, "-m", "venv", "venv-dev"], check=True)
-        
-        # 获取pip路径
-        if platform.system() == "Windows":
-            pip_path = os.path.join("venv-dev", "Scripts", "pip")
-            python_path = os.path.join("venv-dev", "Scripts", "python")
-        else:
-            pip_path = os.path.join("venv-dev", "bin", "pip")
-            python_path = os.path.join("venv-dev", "bin", "python")
-        
-        # 设置环境变量，禁用用户安装模式
-        os.environ['PIP_USER'] = '0'
+        configure_pip_environment()
         
-        # 检测是否使用国内镜像
+        # 检测是否使用国内镜像，pip和uv使用同一个索引
         use_china_mirror = is_in_china()
-        mirror_opt = PIP_MIRROR
+        mirror_args = []
+        mirror_url = None
         if use_china_mirror:
             mirrors = get_pip_mirrors()
             if mirrors:
                 mirror_url = mirrors[0]["url"]
                 mirror_host = mirror_url.split("/")[2]
-                mirror_opt = f"-i {mirror_url} --trusted-host {mirror_host}"
+                mirror_args = ["-i", mirror_url, "--trusted-host", mirror_host]
                 print_info(f"使用{mirrors[0]['name']}镜像源安装依赖")
         
-        # 更新pip
-        print_info("正在更新pip...")
-        try:
-            subprocess.run(f"{python_path} -m pip install --upgrade pip --no-user {mirror_opt}", 
-                          shell=True, check=True, capture_output=True, text=True)
-        except subprocess.CalledProcessError as e:
-            print_warning(f"pip升级失败，但将继续安装: {e.stderr}")
+        # 创建虚拟环境
+        # 非打包环境下直接用当前解释器的venv模块创建，省去一次子进程；
+        # 不使用国内镜像时由EnvBuilder顺带升级pip（upgrade_deps需要Python 3.9+）
+        pip_upgraded = False
+        venv_created = False
+        uv_path = find_uv()
+        if uv_path:
+            # uv创建虚拟环境，--seed同时装入最新的pip，供回退和pip freeze使用
+            print_info("使用uv创建虚拟环境")
+            try:
+                subprocess.run([uv_path, "venv", "venv-dev", "--seed", "--python", python_executable], check=True)
+                venv_created = pip_upgraded = True
+            except (subprocess.CalledProcessError, OSError) as e:
+                # 清理可能残留的半成品目录，改用venv模块创建
+                print_warning(f"uv创建虚拟环境失败，改用venv模块: {e}")
+                shutil.rmtree("venv-dev", ignore_errors=True)
+        
+        if venv_created:
+            pass
+        elif not is_pyinstaller:
+            import venv
+            upgrade_deps = not use_china_mirror and sys.version_info >= (3, 9)
+            if upgrade_deps:
+                print_info("正在更新pip...")
+            builder_options = {'upgrade_deps': True} if upgrade_deps else {}
+            try:
+                venv.EnvBuilder(with_pip=True, symlinks=(os.name != 'nt'), **builder_options).create("venv-dev")
+                pip_upgraded = upgrade_deps
+            except subprocess.CalledProcessError as e:
+                # ensurepip失败时虚拟环境中没有pip，无法继续
+                if not upgrade_deps or "ensurepip" in e.cmd:
+                    print_error(f"在虚拟环境中安装pip失败: {e}")
+                    raise
+                # 虚拟环境已创建，只是pip升级失败
+                print_warning(f"pip升级失败，但将继续安装: {e}")
+                pip_upgraded = True
+        else:
+            subprocess.run([python_executable, "-m", "venv", "venv-dev"], check=True)
+        
+        # 获取pip路径
+        if IS_WINDOWS:
+            pip_path = os.path.join("venv-dev", "Scripts", "pip")
+            python_path = os.path.join("venv-dev", "Scripts", "python")
+        else:
+            pip_path = os.path.join("venv-dev", "bin", "pip")
+            python_path = os.path.join("venv-dev", "bin", "python")
+        
+        # 更新pip，虚拟环境自带的pip已足够新时跳过这次联网升级
+        if not pip_upgraded and get_pip_version(python_path) >= PIP_MIN_VERSION:
+            print_info("pip版本已满足要求，跳过更新")
+        elif not pip_upgraded:
+            print_info("正在更新pip...")
+            try:
+                subprocess.run([python_path, "-m", "pip", "install", "--upgrade", "pip", "--no-user", *mirror_args],
+                               check=True, capture_output=True, text=True)
+            except subprocess.CalledProcessError as e:
+                print_warning(f"pip升级失败，但将继续安装: {e.stderr}")
         
         # 检查requirements.txt是否存在
-        requirements_path = Path("requirements.txt")
-        if requirements_path.exists():
+        mtime_ns = requirements_mtime_ns()
+        if mtime_ns is not None:
             print_info("正在安装依赖包...")
             try:
-                cmd = f"{pip_path} install -r requirements.txt --no-user {mirror_opt}"
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+                cmd = [pip_path, "install", "-r", "requirements.txt", "--no-user", "--no-compile", *mirror_args]
+                if uv_path and uv_pip_install(uv_path, python_path, ["-r", "requirements.txt"], mirror_url):
+                    result = None
+                else:
+                    result = run_streaming(cmd)
                 
-                if result.returncode != 0:
+                if result is not None and result.returncode != 0:
                     print_error(f"使用标准模式安装依赖失败: {result.stderr}")
                     print_info("尝试使用隔离模式安装...")
                     
-                    cmd = f"{pip_path} install -r requirements.txt --no-user --isolated {mirror_opt}"
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+                    cmd = [pip_path, "install", "-r", "requirements.txt", "--no-user", "--no-compile", "--isolated", *mirror_args]
+                    result = run_streaming(cmd)
                     
                     if result.returncode != 0:
                         print_error(f"隔离模式安装也失败: {result.stderr}")
                         print_warning("部分依赖可能未安装成功，但将继续执行")
                 
+                compile_site_packages(python_path)
                 print_info("依赖包安装完成")
             except Exception as e:
                 print_error(f"安装依赖时出错: {str(e)}")
@@ -457,9 +774,7 @@ def create_venv():
             # 保存requirements.txt的哈希值
             current_hash = get_requirements_hash()
             if current_hash:
-                venv_hash_file = Path("venv-dev/.requirements_hash")
-                with open(venv_hash_file, 'w') as f:
-                    f.write(current_hash)
+                save_requirements_record(current_hash, mtime_ns)
         else:
             print_warning("未找到requirements.txt文件，跳过依赖安装")
         
@@ -483,7 +798,7 @@ def run_application():
         return False
     
     # 获取Python解释器路径
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         python_path = os.path.join("venv-dev", "Scripts", "python")
     else:
         python_path = os.path.join("venv-dev", "bin", "python")
@@ -499,16 +814,16 @@ def run_application():
         else:
             print_info("以无控制台模式启动应用...")
             # 在Windows上使用startupinfo隐藏控制台
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 startupinfo = subprocess.STARTUPINFO()
                 startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
                 startupinfo.wShowWindow = 0  # SW_HIDE
                 subprocess.Popen(cmd, startupinfo=startupinfo)
             else:
-                # 在Unix系统上使用nohup或类似命令
-                cmd.insert(0, "nohup")
-                cmd.append("&")
-                subprocess.Popen(" ".join(cmd), shell=True)
+                # 在Unix系统上放入新会话并脱离终端，效果同nohup ... &，但不经过shell
+                subprocess.Popen(cmd, start_new_session=True, close_fds=True,
+                                 stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
         return True
     except Exception as e:
         print_error(f"启动应用失败: {str(e)}")
@@ -516,7 +831,11 @@ def run_application():
         return False
 
 def create_dev_info_file():
-    """创建开发信息辅助文件，记录版本号、目录信息等"""
+    """创建开发信息辅助文件，记录版本号、目录信息等
+    
+    不随启动变化的信息写入DEV_INFO_FILE，只在内容变化时重写；
+    启动时间等每次启动都变化的信息单独写入DEV_RUNTIME_FILE
+    """
     print_info("正在创建开发信息文件...")
     
     # 确保目录存在
@@ -528,23 +847,21 @@ def create_dev_info_file():
             "major": 1,
             "minor": 2,
             "patch": 1,
-            "build": int(time.time()),
             "string": "1.2.1-dev"
         },
         "app": {
             "name": "MGit",
-            "launch_time": datetime.datetime.now().isoformat(),
             "build_type": "development"
         },
         "paths": {
             "app_dir": os.path.abspath(os.getcwd()),
-            "user_home": os.path.expanduser("~"),
-            "app_data": os.path.join(os.path.expanduser("~"), ".mgit"),
+            "user_home": USER_HOME,
+            "app_data": APP_DATA_DIR,
             "plugins_dir": os.path.abspath("plugins"),
-            "user_plugins_dir": os.path.join(os.path.expanduser("~"), ".mgit", "plugins")
+            "user_plugins_dir": os.path.join(APP_DATA_DIR, "plugins")
         },
         "system": {
-            "os": platform.system(),
+            "os": SYSTEM,
             "platform": platform.platform(),
             "python_version": platform.python_version(),
             "hostname": socket.gethostname(),
@@ -555,11 +872,28 @@ def create_dev_info_file():
     # 创建用户插件目录
     os.makedirs(info["paths"]["user_plugins_dir"], exist_ok=True)
     
-    # 写入文件
+    runtime = {
+        "launch_time": datetime.datetime.now().isoformat(),
+        "build": int(time.time()),
+        "pid": os.getpid()
+    }
+    
+    # 写入文件，静态信息与已有文件相同时跳过
     try:
-        with open(DEV_INFO_FILE, 'w', encoding='utf-8') as f:
-            json.dump(info, f, indent=2, ensure_ascii=False)
-        print_info(f"开发信息文件已创建: {DEV_INFO_FILE}")
+        # 不缩进，使用json的C加速编码器
+        content = json.dumps(info, ensure_ascii=False, separators=(',', ':'))
+        try:
+            unchanged = Path(DEV_INFO_FILE).read_text(encoding='utf-8') == content
+        except OSError:
+            unchanged = False
+        if unchanged:
+            print_info("开发信息无变化，跳过写入")
+        else:
+            Path(DEV_INFO_FILE).write_text(content, encoding='utf-8')
+            print_info(f"开发信息文件已创建: {DEV_INFO_FILE}")
+        
+        with open(DEV_RUNTIME_FILE, 'w', encoding='utf-8') as f:
+            json.dump(runtime, f)
         return True
     except Exception as e:
         print_error(f"创建开发信息文件失败: {str(e)}")
@@ -576,26 +910,21 @@ def add_dependencies_to_requirements(dependencies):
         existing_deps = []
         plugin_section_index = -1
         
-        if os.path.exists(req_file_path):
-            with open(req_file_path, 'r', encoding='utf-8') as f:
-                existing_lines = f.readlines()
-                # 去除每行末尾的换行符
-                existing_lines = [line.rstrip() for line in existing_lines]
-                
-                # 分析已有内容
-                for i, line in enumerate(existing_lines):
-                    if line.strip() and not line.strip().startswith('#'):
-                        existing_deps.append(line.strip())
-                    if line.strip() == "# 插件依赖":
-                        plugin_section_index = i
-        
-        # 准备新的依赖列表
-        new_deps = []
-        for dep in dependencies:
-            # 检查依赖是否已存在
-            dep_name = dep.split('>')[0].split('=')[0].split('<')[0].strip()
-            if not any(d.startswith(dep_name) for d in existing_deps):
-                new_deps.append(dep)
+        requirements = load_requirements(Path(req_file_path))
+        if requirements is not None:
+            # 去除每行末尾的换行符
+            existing_lines = [line.rstrip() for line in requirements[0].decode('utf-8').splitlines()]
+            
+            # 分析已有内容
+            for i, line in enumerate(existing_lines):
+                if line.strip() and not line.strip().startswith('#'):
+                    existing_deps.append(line.strip())
+                if line.strip() == "# 插件依赖":
+                    plugin_section_index = i
+        
+        # 准备新的依赖列表，按规范化包名整体比较，避免requests误匹配requests-toolbelt
+        existing_names = {requirement_name(d) for d in existing_deps}
+        new_deps = [dep for dep in dependencies if requirement_name(dep) not in existing_names]
         
         if not new_deps:
             print_info("没有新的依赖需要添加到requirements.txt")
@@ -616,15 +945,11 @@ def add_dependencies_to_requirements(dependencies):
             while insert_position < len(existing_lines) and existing_lines[insert_position].strip() and not existing_lines[insert_position].strip().startswith('#'):
                 insert_position += 1
             
-            # 插入新依赖
-            for dep in reversed(new_deps):
-                existing_lines.insert(insert_position, dep)
+            # 一次切片插入全部新依赖
+            existing_lines[insert_position:insert_position] = new_deps
         
-        # 写入文件
-        with open(req_file_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(existing_lines))
-            # 确保文件末尾有换行符
-            f.write('\n')
+        # 写入文件，确保文件末尾有换行符
+        Path(req_file_path).write_text('\n'.join(existing_lines) + '\n', encoding='utf-8')
         
         print_info(f"已将以下依赖添加到requirements.txt: {', '.join(new_deps)}")
         return True
@@ -644,11 +969,47 @@ def add_dependencies_to_requirements(dependencies):
         return False
 
 def is_in_china():
-    """检测是否在中国网络环境"""
+    """检测是否在中国网络环境
+    
+    检测结果缓存在NETWORK_ENV_FILE中，有效期内直接复用，避免每次启动都探测网络
+    """
     try:
-        import socket
-        import urllib.request
-        import time
+        with open(NETWORK_ENV_FILE, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        if time.time() - saved["ts"] < NETWORK_ENV_TTL:
+            in_china = bool(saved["in_china"])
+            if in_china:
+                print_info("使用缓存的网络环境检测结果：国内网络，将使用阿里云镜像源")
+            return in_china
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    in_china = probe_china_network()
+    # 探测失败（离线等）时不写缓存，下次启动重新探测
+    if in_china is None:
+        return False
+    try:
+        os.makedirs(os.path.dirname(NETWORK_ENV_FILE), exist_ok=True)
+        with open(NETWORK_ENV_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"in_china": in_china, "ts": time.time(), "method": "probe"}, f)
+    except OSError as e:
+        print_warning(f"保存网络环境检测结果失败: {str(e)}")
+    return in_china
+
+def probe_host(host):
+    """向站点发送HEAD请求，返回响应耗时（秒），失败返回None"""
+    try:
+        request = urllib.request.Request(f"http://{host}", method="HEAD")
+        start_time = time.time()
+        with urllib.request.urlopen(request, timeout=3):
+            return time.time() - start_time
+    except Exception:
+        return None
+
+def probe_china_network():
+    """通过比较国内外站点的响应时间探测网络环境，所有站点均无响应时返回None"""
+    try:
+        from concurrent.futures import ThreadPoolExecutor, wait
         
         # 设置超时
         socket.setdefaulttimeout(5)
@@ -659,26 +1020,27 @@ def is_in_china():
             "global": ["google.com", "github.com", "pypi.org"]
         }
         
-        china_response_times = []
-        global_response_times = []
+        # 所有站点并发探测，总耗时受单个超时约束，而不是逐个累加
+        executor = ThreadPoolExecutor(max_workers=len(domains["china"]) + len(domains["global"]))
+        try:
+            futures = {
+                region: [executor.submit(probe_host, domain) for domain in hosts]
+                for region, hosts in domains.items()
+            }
+            wait([f for fs in futures.values() for f in fs], timeout=4)
+        finally:
+            executor.shutdown(wait=False)
         
-        for domain in domains["china"]:
-            try:
-                start_time = time.time()
-                urllib.request.urlopen(f"http://{domain}", timeout=3)
-                response_time = time.time() - start_time
-                china_response_times.append(response_time)
-            except:
-                pass
-                
-        for domain in domains["global"]:
-            try:
-                start_time = time.time()
-                urllib.request.urlopen(f"http://{domain}", timeout=3)
-                response_time = time.time() - start_time
-                global_response_times.append(response_time)
-            except:
-                pass
+        def response_times(region):
+            return [f.result() for f in futures[region]
+                    if f.done() and f.result() is not None]
+        
+        china_response_times = response_times("china")
+        global_response_times = response_times("global")
+        
+        if not china_response_times and not global_response_times:
+            print_warning("网络环境检测失败，默认不使用国内镜像")
+            return None
         
         # 如果国内站点响应快，国外站点响应慢或无响应，判断为国内网络
         if (china_response_times and 
@@ -689,82 +1051,205 @@ def is_in_china():
         return False
     except:
         print_warning("网络环境检测失败，默认不使用国内镜像")
-        return False
+        return None
 
+@lru_cache(maxsize=None)
 def get_pip_mirrors():
-    """获取推荐的pip镜像源列表"""
-    mirrors = [
+    """获取推荐的pip镜像源列表（结果被缓存，调用方不应修改）"""
+    mirrors = (
         {"name": "阿里云", "url": "https://mirrors.aliyun.com/pypi/simple/"},
         {"name": "腾讯云", "url": "https://mirrors.cloud.tencent.com/pypi/simple/"},
         {"name": "华为云", "url": "https://repo.huaweicloud.com/repository/pypi/simple/"},
         {"name": "清华大学", "url": "https://pypi.tuna.tsinghua.edu.cn/simple/"},
         {"name": "中国科技大学", "url": "https://pypi.mirrors.ustc.edu.cn/simple/"}
-    ]
+    )
     return mirrors
 
+def parse_plugin_dependencies(plugin_path):
+    """静态解析插件源码中的依赖声明，不执行插件代码
+    
+    返回 (插件名, 依赖列表)；无法静态确定时返回None，由调用方回退到inspect_plugin
+    """
+    plugin_name = os.path.splitext(os.path.basename(plugin_path))[0]
+    source = Path(plugin_path).read_text(encoding='utf-8')
+    
+    # 源码中根本没有提到package_dependencies，插件只会继承PluginBase的空列表
+    if 'package_dependencies' not in source:
+        return plugin_name, []
+    
+    tree = ast.parse(source, filename=plugin_path)
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == 'Plugin'):
+            continue
+        
+        dependencies = None
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign):
+                targets = stmt.targets
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                targets = [stmt.target]
+            else:
+                continue
+            for target in targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                if target.id == 'package_dependencies':
+                    try:
+                        dependencies = list(ast.literal_eval(stmt.value))
+                    except ValueError:
+                        # 依赖列表不是字面量，只能反射加载
+                        return None
+                elif target.id == 'name' and isinstance(stmt.value, ast.Constant) \
+                        and isinstance(stmt.value.value, str):
+                    plugin_name = stmt.value.value
+        
+        if dependencies is not None:
+            return plugin_name, dependencies
+    
+    return None
+
+def inspect_plugin(plugin_path):
+    """加载单个插件并返回 (插件名, 依赖列表)，在独立的工作进程中执行"""
+    import importlib.util
+    import inspect
+    
+    plugin_name = os.path.splitext(os.path.basename(plugin_path))[0]
+    
+    # 反射加载插件模块
+    spec = importlib.util.spec_from_file_location(f"plugins.{plugin_name}", plugin_path)
+    if spec is None:
+        return plugin_name, []
+    
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    if not hasattr(module, 'Plugin'):
+        return plugin_name, []
+    
+    # 检查插件是否定义了package_dependencies
+    plugin_class = module.Plugin
+    try:
+        # 插件类应该至少有一个初始化方法，判断参数个数
+        sig = inspect.signature(plugin_class.__init__)
+        params = list(sig.parameters.values())
+        
+        # 如果只需要self参数
+        if len(params) == 1:
+            plugin_instance = plugin_class()
+        else:
+            # 创建一个临时空对象，让插件有正确的self参数
+            class TempApp:
+                pass
+            plugin_instance = plugin_class(TempApp())
+    except Exception as e:
+        raise RuntimeError(f"检查插件 {plugin_name} 依赖时出错: {str(e)}") from e
+    
+    plugin_name = getattr(plugin_instance, 'name', plugin_name)
+    return plugin_name, list(getattr(plugin_instance, 'package_dependencies', None) or [])
+
 def scan_plugin_dependencies():
-    """扫描plugins目录，查找所有插件依赖"""
+    """扫描plugins目录，查找所有插件依赖
+    
+    优先静态解析插件源码；无法静态确定的插件才在独立的工作进程中并行加载，
+    插件导入的重量级库或崩溃不会影响启动器本身
+    """
     try:
-        import importlib.util
+        from concurrent.futures import ProcessPoolExecutor
         
         plugins_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plugins')
         if not os.path.exists(plugins_dir):
             print_info("插件目录不存在，跳过依赖扫描")
             return []
         
-        all_dependencies = []
+        plugin_files = [os.path.join(plugins_dir, file)
+                        for file in os.listdir(plugins_dir) if file.endswith('.py')]
+        if not plugin_files:
+            return []
         
-        # 遍历插件目录下的文件
-        for file in os.listdir(plugins_dir):
-            if file.endswith('.py'):
-                plugin_name = file[:-3]  # 移除.py扩展名
-                try:
-                    # 反射加载插件模块
-                    spec = importlib.util.spec_from_file_location(
-                        f"plugins.{plugin_name}", 
-                        os.path.join(plugins_dir, file)
-                    )
-                    
-                    if spec is None:
-                        continue
-                    
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    
-                    if hasattr(module, 'Plugin'):
-                        # 检查插件是否定义了package_dependencies
-                        plugin_class = module.Plugin
-                        try:
-                            # 插件类应该至少有一个初始化方法，判断参数个数
-                            import inspect
-                            sig = inspect.signature(plugin_class.__init__)
-                            params = list(sig.parameters.values())
-                            
-                            # 如果只需要self参数
-                            if len(params) == 1:
-                                plugin_instance = plugin_class()
-                            else:
-                                # 创建一个临时空对象，让插件有正确的self参数
-                                class TempApp:
-                                    pass
-                                plugin_instance = plugin_class(TempApp())
-                            
-                            if hasattr(plugin_instance, 'package_dependencies') and plugin_instance.package_dependencies:
-                                plugin_name = getattr(plugin_instance, 'name', plugin_name)
-                                print_info(f"检测到插件 '{plugin_name}' 的依赖项")
-                                all_dependencies.extend(plugin_instance.package_dependencies)
-                        except Exception as e:
-                            print_warning(f"检查插件 {plugin_name} 依赖时出错: {str(e)}")
-                except Exception as e:
-                    print_warning(f"加载插件 {plugin_name} 失败: {str(e)}")
+        # 按文件顺序保存结果，None表示需要反射加载
+        results = {}
+        for path in plugin_files:
+            try:
+                results[path] = parse_plugin_dependencies(path)
+            except (OSError, SyntaxError, UnicodeDecodeError, TypeError) as e:
+                print_warning(f"静态解析插件 {os.path.basename(path)} 失败: {str(e)}")
+                results[path] = None
+        
+        pending = [path for path, result in results.items() if result is None]
+        if pending:
+            max_workers = min(len(pending), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [(path, executor.submit(inspect_plugin, path)) for path in pending]
+                for path, future in futures:
+                    try:
+                        results[path] = future.result()
+                    except Exception as e:
+                        plugin_name = os.path.splitext(os.path.basename(path))[0]
+                        print_warning(f"加载插件 {plugin_name} 失败: {str(e)}")
+                        del results[path]
+        
+        all_dependencies = []
+        for plugin_name, dependencies in results.values():
+            if dependencies:
+                print_info(f"检测到插件 '{plugin_name}' 的依赖项")
+                all_dependencies.extend(dependencies)
         
         return all_dependencies
     except Exception as e:
         print_error(f"扫描插件依赖时出错: {str(e)}")
         return []
 
+def plugins_fingerprint():
+    """根据plugins目录下各插件文件和requirements.txt的名称、大小和修改时间计算指纹，只需stat不需读取内容
+    
+    包含requirements.txt，手动编辑（例如删除插件依赖段）后会重新检查插件依赖
+    """
+    plugins_dir = Path(os.path.dirname(os.path.abspath(__file__))) / 'plugins'
+    digest = hashlib.blake2b()
+    for path in sorted(plugins_dir.glob('*.py')):
+        st = path.stat()
+        digest.update(f"{path.name}|{st.st_size}|{st.st_mtime_ns}\n".encode('utf-8'))
+    try:
+        st = Path("requirements.txt").stat()
+        digest.update(f"requirements.txt|{st.st_size}|{st.st_mtime_ns}\n".encode('utf-8'))
+    except FileNotFoundError:
+        digest.update(b"requirements.txt|missing\n")
+    return digest.hexdigest()
+
 def check_and_add_plugin_dependencies_to_requirements():
-    """检查插件依赖是否在requirements.txt中，如果不存在则添加"""
+    """检查插件依赖是否在requirements.txt中，如果不存在则添加
+    
+    插件文件自上次成功检查后没有变化时直接跳过，不再扫描插件
+    """
+    fingerprint_file = Path(PLUGINS_FINGERPRINT_FILE)
+    try:
+        fingerprint = plugins_fingerprint()
+        try:
+            # 直接读取，文件不存在时由异常处理，不再单独stat一次
+            unchanged = fingerprint_file.read_text().strip() == fingerprint
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            print_info("插件无变化，跳过插件依赖检查")
+            return True
+    except OSError as e:
+        print_warning(f"计算插件指纹失败: {str(e)}")
+        fingerprint = None
+    
+    if not sync_plugin_dependencies():
+        return False
+    
+    # 虚拟环境尚未创建时不记录指纹，创建后的下一次启动会重新检查
+    if fingerprint and fingerprint_file.parent.exists():
+        try:
+            # 同步时可能追加了依赖，重新计算以包含更新后的requirements.txt
+            fingerprint_file.write_text(plugins_fingerprint())
+        except OSError as e:
+            print_warning(f"保存插件指纹失败: {str(e)}")
+    return True
+
+def sync_plugin_dependencies():
+    """扫描插件依赖并把requirements.txt中缺少的依赖追加进去"""
     # 获取所有插件依赖
     plugin_dependencies = scan_plugin_dependencies()
     if not plugin_dependencies:
@@ -810,12 +1295,13 @@ def check_and_add_plugin_dependencies_to_requirements():
     
     # 读取requirements.txt，检查依赖是否已存在
     try:
+        data = load_requirements(Path(req_file_path))[0]
+        content = data.decode('utf-8')
         existing_deps = []
-        with open(req_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    existing_deps.append(line)
+        for line in content.splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                existing_deps.append(line)
         
         # 找出需要添加的依赖
         new_deps = []
@@ -829,18 +1315,12 @@ def check_and_add_plugin_dependencies_to_requirements():
             return True
         
         # 添加新依赖到requirements.txt
-        with open(req_file_path, 'a+', encoding='utf-8') as f:
-            f.seek(0, os.SEEK_END)
-            # 确保文件不是以换行符结尾
-            if f.tell() > 0:
-                f.seek(f.tell() - 1)
-                last_char = f.read(1)
-                if last_char != '\n':
-                    f.write('\n')
+        with open(req_file_path, 'a', encoding='utf-8') as f:
+            # 确保文件以换行符结尾
+            if data and not data.endswith(b'\n'):
+                f.write('\n')
             
             # 检查是否有插件依赖部分
-            f.seek(0)
-            content = f.read()
             if "# 插件依赖" not in content:
                 f.write("\n# 插件依赖\n")
             
@@ -885,13 +1365,16 @@ def main():
         input("按Enter键退出...")
         sys.exit(1)
     
-    # 检查并更新包 - 这会处理所有在requirements.txt中的依赖，包括刚添加的插件依赖
-    check_and_update_packages()
+    # create_venv已经处理了requirements.txt中的全部依赖（包括刚添加的插件依赖）：
+    # 新建时直接安装，已存在时调用check_and_update_packages，这里无需再检查一次
     
     # 运行应用
     run_application()
     
 if __name__ == "__main__":
+    # PyInstaller打包后，插件扫描的工作进程需要freeze_support才能正确启动
+    import multiprocessing
+    multiprocessing.freeze_support()
     try:
         main()
     except KeyboardInterrupt:
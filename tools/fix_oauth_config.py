@@ -38,6 +38,17 @@ def backup_file(file_path):
             return False
     return False
 
+def move_to_backup(file_path):
+    """把文件重命名为备份文件，代替先复制再删除原文件"""
+    backup_path = f"{file_path}.bak.{int(time.time())}"
+    try:
+        os.rename(file_path, backup_path)
+        info(f"已备份文件: {file_path} -> {backup_path}")
+        return True
+    except Exception as e:
+        error(f"备份文件失败: {str(e)}")
+        return False
+
 def reset_oauth_config():
     """重置OAuth配置文件"""
     # 获取MGit配置目录
@@ -52,18 +63,11 @@ def reset_oauth_config():
     # OAuth配置文件路径
     oauth_config_file = os.path.join(config_dir, 'oauth_config.dat')
     
-    # 备份现有配置文件
+    # 备份并移除现有配置文件，同一目录内重命名即可，无需复制
     if os.path.exists(oauth_config_file):
-        if not backup_file(oauth_config_file):
-            return False
-        
-        # 删除现有配置文件
-        try:
-            os.remove(oauth_config_file)
-            info(f"已删除现有OAuth配置文件: {oauth_config_file}")
-        except Exception as e:
-            error(f"删除OAuth配置文件失败: {str(e)}")
+        if not move_to_backup(oauth_config_file):
             return False
+        info(f"已删除现有OAuth配置文件: {oauth_config_file}")
     
     info("OAuth配置已重置")
     return True
@@ -112,16 +116,12 @@ def cleanup_ssl_certs():
         info("SSL证书目录不存在，无需清理")
         return True
     
-    # 备份证书目录
+    # 备份并移除证书目录，同一文件系统内重命名即可，不必逐个复制证书再删除
     backup_dir = f"{cert_dir}.bak.{int(time.time())}"
     try:
-        if os.path.exists(cert_dir):
-            shutil.copytree(cert_dir, backup_dir)
-            info(f"已备份SSL证书目录: {backup_dir}")
-            
-            # 删除证书目录
-            shutil.rmtree(cert_dir)
-            info(f"已删除SSL证书目录: {cert_dir}")
+        os.rename(cert_dir, backup_dir)
+        info(f"已备份SSL证书目录: {backup_dir}")
+        info(f"已删除SSL证书目录: {cert_dir}")
         return True
     except Exception as e:
         error(f"清理SSL证书失败: {str(e)}")
@@ -35,9 +35,15 @@ try:
     QApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
     QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings, True)
     
-    # 强制预先导入WebEngine相关模块
-    import PyQt5.QtWebEngineWidgets
-    print("WebEngine模块导入成功")
+    # 预先导入WebEngine相关模块；设置MGIT_ENABLE_WEBENGINE=0时跳过这次庞大的库加载。
+    # 此时预览组件（以及GitPanel引用的oauth_handler）会在QApplication创建之后才延迟导入
+    # QtWebEngineWidgets，这只有在src/main.py创建QApplication前设置了AA_ShareOpenGLContexts时才可行，
+    # 不要删除那里的这项属性
+    if os.environ.get("MGIT_ENABLE_WEBENGINE", "1") == "1":
+        import PyQt5.QtWebEngineWidgets
+        print("WebEngine模块导入成功")
+    else:
+        print("已跳过WebEngine模块预加载")
     
     print("WebEngine预初始化成功")
 except Exception as e: